@@ -1,5 +1,15 @@
+import hashlib
+import json
+import os
 import re
-from typing import Any, Dict, Iterable, List, Optional
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 NUMERIC_TOL_ABS = 0.01
 NUMERIC_TOL_REL = 0.01
@@ -104,6 +114,31 @@ def normalize_pmid(value: Any) -> Optional[str]:
     return str(value)
 
 
+def dumps_json(value: Any, sort_keys: bool = False, indent: bool = False) -> str:
+    """JSON text (UTF-8, no ASCII escaping), compact unless indent; uses orjson when installed."""
+    if orjson is not None:
+        option = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def clone_json(value: Any) -> Any:
+    """Deep-copy plain JSON data (dicts, lists, scalars) without copy.deepcopy's memo overhead."""
+    if isinstance(value, dict):
+        return {k: clone_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [clone_json(v) for v in value]
+    return value
+
+
 def json_pointer_get(obj: Any, pointer: str) -> Any:
     if pointer in ("", "/"):
         return obj
@@ -127,6 +162,25 @@ def json_pointer_get(obj: Any, pointer: str) -> Any:
     return cur
 
 
+def flatten_json_pointer(obj: Any) -> Dict[str, Any]:
+    """Map every JSON pointer in obj to its value, so lookups match json_pointer_get(obj, pointer)."""
+    flat: Dict[str, Any] = {}
+    stack = [("", obj)]
+    while stack:
+        prefix, cur = stack.pop()
+        if isinstance(cur, dict):
+            items = ((str(k).replace("~", "~0").replace("/", "~1"), v) for k, v in cur.items())
+        elif isinstance(cur, list):
+            items = ((str(i), v) for i, v in enumerate(cur))
+        else:
+            continue
+        for token, value in items:
+            pointer = f"{prefix}/{token}"
+            flat[pointer] = value
+            stack.append((pointer, value))
+    return flat
+
+
 def json_pointer_set(obj: Any, pointer: str, value: Any) -> None:
     if pointer in ("", "/"):
         raise ValueError("json pointer cannot be empty when setting")
@@ -156,8 +210,11 @@ def json_pointer_set(obj: Any, pointer: str, value: Any) -> None:
             raise ValueError("json pointer target is not a container")
 
 
+EVIDENCE_PAGE_RE = re.compile(r"\bPAGE\s+(\d+)\b")
+
+
 def extract_page_from_evidence(evidence_text: str) -> Optional[int]:
-    match = re.search(r"\bPAGE\s+(\d+)\b", evidence_text or "")
+    match = EVIDENCE_PAGE_RE.search(evidence_text or "")
     if match:
         try:
             return int(match.group(1))
@@ -179,3 +236,114 @@ def dedupe_decisions(task_results: Iterable[Dict[str, Any]]) -> List[Dict[str, A
             decisions_by_path[path] = decision
             ordered_paths.append(path)
     return [decisions_by_path[p] for p in ordered_paths]
+
+
+class ExtractionCache:
+    """Content-addressed on-disk store for LLM JSON responses.
+
+    Keys are sha256 digests over length-prefixed parts, so ("ab", "c") and
+    ("a", "bc") never collide. Entries are plain JSON files; unreadable
+    entries are treated as misses.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Union[str, bytes]) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+            h.update(len(data).to_bytes(8, "big"))
+            h.update(data)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "payload" not in entry:
+            return None
+        return entry["payload"]
+
+    def set(self, key: str, payload: Any, model: Optional[str] = None) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "payload": payload,
+            "model": model,
+            "ts_utc": datetime.now(timezone.utc).isoformat(),
+        }
+        # Write to a temp file and rename so concurrent readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+def _read_state_entries(path: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """Entries in a state file, and whether it needs rewriting as clean JSONL."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.lstrip().startswith(b"["):
+        # Legacy format: a single JSON list rewritten after every PDF.
+        payload = loads_json(data)
+        return ([e for e in payload if isinstance(e, dict)] if isinstance(payload, list) else []), True
+    entries: List[Dict[str, Any]] = []
+    dirty = bool(data) and not data.endswith(b"\n")
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = loads_json(line)
+        except ValueError:
+            dirty = True  # e.g. a line cut short by an interrupted run
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries, dirty
+
+
+def load_processed_state(state_path: str, legacy_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Entries of the append-only JSONL state log at state_path.
+
+    A legacy JSON list (at state_path, or at legacy_path while state_path does not
+    exist yet) is migrated by writing state_path as JSONL. Unparseable lines are
+    dropped and the file rewritten, so later appends start on a clean line.
+    """
+    source = state_path
+    if not os.path.exists(state_path):
+        if not legacy_path or not os.path.exists(legacy_path):
+            return []
+        source = legacy_path
+    entries, rewrite = _read_state_entries(source)
+    if rewrite or source != state_path:
+        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+        with open(state_path, "w", encoding="utf-8") as f:
+            f.write("".join(dumps_json(e) + "\n" for e in entries))
+    return entries
+
+
+def append_processed_state(state_path: str, entry: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+    with open(state_path, "a", encoding="utf-8") as f:
+        f.write(dumps_json(entry) + "\n")
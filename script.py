@@ -9,7 +9,7 @@
 # - Writes values that match the Excel template data-validations (e.g., "Yes/No/Unclear/Not Applicable", "+1/-1/0" where expected).
 #
 # Dependencies:
-#   pip install -U openai PyYAML pymupdf python-docx openpyxl jsonschema
+#   pip install -U openai PyYAML pymupdf python-docx openpyxl jsonschema lxml
 #
 # Notes:
 # - Configure OPENAI_API_KEY via env vars or pass to run_pipeline().
@@ -19,24 +19,42 @@
 # - "Level of Evidence" and "Grade of Recommendation" REQUIRE a locally agreed framework (e.g., Oxford/SIGN/GRADE/AWMF).
 #   This script can fill them if you provide definitions, but by default it leaves them null unless explicitly stated in the paper.
 
-import os, json, re, copy, random, time
+import os, re, copy, random, time
+import base64
+import http.client
+import threading
 import urllib.parse
 import urllib.request
 from typing import Optional
 from datetime import datetime, UTC
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
 
 import fitz  # PyMuPDF
 import openpyxl
 from openpyxl.styles import PatternFill
+from openpyxl.utils.cell import column_index_from_string as _openpyxl_column_index, get_column_letter
 from docx import Document
 import yaml
+import jsonschema
+
+try:
+    import fastjsonschema  # optional: compiled validators, much faster than jsonschema
+except ImportError:
+    fastjsonschema = None
 
 from openai import OpenAI
 from paperchecker_utils import (
+    ExtractionCache,
+    append_processed_state,
+    clone_json,
     dedupe_decisions,
+    dumps_json,
     extract_page_from_evidence,
-    json_pointer_get,
+    flatten_json_pointer,
+    load_processed_state,
+    loads_json,
     normalize_excel_value,
     normalize_pmid,
     sanitize_for_office,
@@ -66,14 +84,30 @@ REASONING_EFFORT_OPENAI = "medium"   # none|low|medium|high|xhigh
 # Verifier-specific reasoning (lower = faster, still accurate for verification)
 VERIFIER_REASONING_EFFORT_OPENAI = "low"  # none|low|medium|high|xhigh
 
+# Per-task overrides for the extraction effort (task_name -> effort), e.g.
+# {"indication_drugs_route_site": "low"}. Tasks not listed use REASONING_EFFORT_OPENAI.
+TASK_REASONING_EFFORT_OPENAI = {}
+
 MAX_VIEW_CHARS = 500000  # Increased - modern LLMs support large context
 TASK_VIEW_CHARS = 500000  # Increased - modern LLMs support large context
-VERIFIER_CHUNK_SIZE = 24
+FULL_VIEW_DEDUP_MIN_CHARS = 200  # Paragraphs this long are sent once even if repeated; 0 disables
+VERIFIER_CHUNK_SIZE = 48  # Decisions per verifier call; most tasks fit in a single call
 VERIFIER_PARALLEL_WORKERS = 3  # Number of parallel verification chunks
+PDF_PARALLEL_WORKERS = 2  # PDFs extracted concurrently in run_pipeline (outputs are still written in order)
+# Cap on in-flight API requests across tasks, verifier chunks and parallel PDFs.
+LLM_MAX_CONCURRENT_CALLS = 8
 LLM_MAX_RETRIES = 3
 LLM_BACKOFF_SECONDS = 2.0
 LLM_BACKOFF_JITTER = 0.25
 
+# Per-paper audit JSON next to the workbook (full evidence trail). Disable for large batches
+# where only the workbook and review log are needed.
+WRITE_AUDIT_JSON = True
+
+# Optional on-disk cache of LLM responses keyed by model, effort, schema and prompt.
+# Re-running the same PDFs with unchanged settings then skips the API calls. Off when unset.
+LLM_CACHE_DIR = os.getenv("PC_CACHE_DIR")
+
 # Optional PMID lookup (PubMed E-utilities). When enabled, missing PMIDs can be
 # resolved from DOI/title using a lightweight web request.
 ENABLE_PUBMED_LOOKUP = True
@@ -280,6 +314,9 @@ STUDY_DESIGN_ENUM = [
 ]
 
 APPRAISAL_YNUA_ENUM = ["Yes", "No", "Unclear", "Not Applicable"]
+# Shared, read-only enum fragments (Yes/No/Unclear/Not Applicable answers, study design).
+_YNUA_SCHEMA = {"type": ["string", "null"], "enum": APPRAISAL_YNUA_ENUM + [None]}
+_STUDY_DESIGN_SCHEMA = {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]}
 MRONJ_DEV_ENUM = ["Yes", "No"]
 
 # -------------------------
@@ -288,50 +325,94 @@ MRONJ_DEV_ENUM = ["Yes", "No"]
 
 def deep_merge(a, b):
     if not isinstance(a, dict) or not isinstance(b, dict):
-        return copy.deepcopy(b)
-    out = copy.deepcopy(a)
-    for k, v in b.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = deep_merge(out[k], v)
+        return clone_json(b)
+    # Each node is copied exactly once; keys keep a's order with b's new keys appended.
+    out = {}
+    for k, v in a.items():
+        if k not in b:
+            out[k] = clone_json(v)
+        elif isinstance(v, dict) and isinstance(b[k], dict):
+            out[k] = deep_merge(v, b[k])
         else:
-            out[k] = copy.deepcopy(v)
+            out[k] = clone_json(b[k])
+    for k, v in b.items():
+        if k not in a:
+            out[k] = clone_json(v)
     return out
 
 def deep_merge_non_null(a, b):
     if b is None:
-        return copy.deepcopy(a)
+        return clone_json(a)
     if not isinstance(a, dict) or not isinstance(b, dict):
-        return copy.deepcopy(b)
-    out = copy.deepcopy(a)
+        return clone_json(b)
+    out = {}
+    for k, v in a.items():
+        bv = b.get(k)
+        if bv is None:
+            out[k] = clone_json(v)
+        elif isinstance(v, dict) and isinstance(bv, dict):
+            out[k] = deep_merge_non_null(v, bv)
+        else:
+            out[k] = clone_json(bv)
     for k, v in b.items():
+        if k not in a and v is not None:
+            out[k] = clone_json(v)
+    return out
+
+def _merge_into(target, patch):
+    """deep_merge(target, patch) applied in place; only patch values are copied."""
+    for k, v in patch.items():
+        tv = target.get(k)
+        if isinstance(v, dict) and isinstance(tv, dict):
+            _merge_into(tv, v)
+        else:
+            target[k] = clone_json(v)
+
+def _merge_non_null_into(target, patch):
+    """deep_merge_non_null(target, patch) applied in place to a target the caller owns.
+
+    Only patch values are copied, so applying a patch costs the size of the patch
+    rather than a copy of the whole working object.
+    """
+    for k, v in patch.items():
         if v is None:
             continue
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = deep_merge_non_null(out[k], v)
+        tv = target.get(k)
+        if isinstance(v, dict) and isinstance(tv, dict):
+            _merge_non_null_into(tv, v)
         else:
-            out[k] = copy.deepcopy(v)
-    return out
+            target[k] = clone_json(v)
+
+_MODEL_INPUT_EXCLUDED_KEYS = frozenset(("verification", "validation", "model_meta", "model"))
 
 def sanitize_for_model_input(obj):
+    # The result is only serialized for prompts, so nested values are shared, not copied.
     if not isinstance(obj, dict):
         return obj
-    scrub = copy.deepcopy(obj)
-    for k in list(scrub.keys()):
-        if k in ("verification", "validation", "model_meta", "model"):
-            scrub.pop(k, None)
-    return scrub
+    return {k: v for k, v in obj.items() if k not in _MODEL_INPUT_EXCLUDED_KEYS}
 
 
 # -------------------------
 # EXCEL WRITE HELPERS (avoid overwriting demo rows unless matching PMID)
 # -------------------------
+# "A".."ZZ" covers every template column; anything else goes through openpyxl.
+_COLUMN_INDEX = {get_column_letter(i): i for i in range(1, 703)}
+
 def column_index_from_string(col):
-    col = col.upper().strip()
-    idx = 0
-    for c in col:
-        idx = idx * 26 + (ord(c) - ord("A") + 1)
+    idx = _COLUMN_INDEX.get(col)
+    if idx is None:
+        idx = _openpyxl_column_index(col.upper().strip())
     return idx
 
+def _build_column_plans(excel_map):
+    """Per sheet, an ordered {field: column index} map so writes skip letter parsing."""
+    return {
+        sheet_key: {field: column_index_from_string(col) for field, col in (sheet_cfg.get("columns") or {}).items()}
+        for sheet_key, sheet_cfg in (excel_map.get("sheets") or {}).items()
+    }
+
+_EXCEL_COLUMN_PLANS = _build_column_plans(EXCEL_MAP)
+
 
 # Human-readable column headers
 COLUMN_DISPLAY_NAMES = {
@@ -445,7 +526,6 @@ COLUMN_DISPLAY_NAMES = {
 def create_template_workbook(excel_map):
     """Generate a fresh Excel workbook with headers based on EXCEL_MAP structure."""
     from openpyxl.styles import Font, Alignment, PatternFill
-    from openpyxl.utils import get_column_letter
 
     wb = openpyxl.Workbook()
     # Remove default sheet
@@ -517,19 +597,26 @@ def _find_row_by_key(ws, key_col_letter, key_value, start_row):
     key_col_idx = column_index_from_string(key_col_letter)
     normalized_key = normalize_pmid(key_value)
     max_row = max(ws.max_row, start_row)
-    for r in range(start_row, max_row + 1):
-        cell_val = ws.cell(r, key_col_idx).value
-        if normalized_key is not None:
-            if values_match(normalize_pmid(cell_val), normalized_key):
+    (key_values,) = ws.iter_cols(min_col=key_col_idx, max_col=key_col_idx, min_row=start_row, max_row=max_row, values_only=True)
+    if normalized_key is not None:
+        # Normalized PMIDs are stripped strings, so plain equality is what values_match would do.
+        for r, cell_val in enumerate(key_values, start=start_row):
+            if cell_val is not None and normalize_pmid(cell_val) == normalized_key:
                 return r
-        elif values_match(cell_val, key_value):
+        return None
+    for r, cell_val in enumerate(key_values, start=start_row):
+        if values_match(cell_val, key_value):
             return r
     return None
 
 def _find_first_truly_empty_row(ws, start_row, end_col=None):
     end_col = end_col or ws.max_column
     max_row = max(ws.max_row, start_row)
-    for r in range(start_row, max_row + 1):
+    # Bulk value scan first; only rows with no values get the per-cell formula/style check.
+    rows = ws.iter_rows(min_row=start_row, max_row=max_row, max_col=end_col, values_only=True)
+    for r, values in enumerate(rows, start=start_row):
+        if any(v not in (None, "") for v in values):
+            continue
         if not _row_has_any_values(ws, r, 1, end_col):
             return r
     return max_row + 1
@@ -570,15 +657,20 @@ def _parse_sheet_field_from_path(path: Optional[str]) -> Optional[tuple[str, str
         return None
     return parts[2], parts[3]
 
+SEVERITY_RANK = {"CRITICAL": 3, "WARN": 2, "INFO": 1}
+
+# openpyxl stores fills by value, so one instance per severity can be shared across cells.
+_SEVERITY_FILLS = {
+    "CRITICAL": PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+    "WARN": PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+}
+_DEFAULT_SEVERITY_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+
 def _severity_rank(severity: str) -> int:
-    return {"CRITICAL": 3, "WARN": 2, "INFO": 1}.get(severity, 0)
+    return SEVERITY_RANK.get(severity, 0)
 
 def _fill_for_severity(severity: str) -> PatternFill:
-    if severity == "CRITICAL":
-        return PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-    if severity == "WARN":
-        return PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-    return PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+    return _SEVERITY_FILLS.get(severity, _DEFAULT_SEVERITY_FILL)
 
 INTEGER_COUNT_FIELDS = {
     "mronj_stage_at_risk",
@@ -597,6 +689,10 @@ NUMERIC_REVIEW_FIELDS = {
     "total_score",
 }
 
+_NUMERIC_RE = re.compile(r"[-+]?\d+(\.\d+)?")
+_INT_RE = re.compile(r"[-+]?\d+")
+_INT_WITH_ZERO_FRACTION_RE = re.compile(r"[-+]?\d+\.0+")
+
 def _is_numeric_like(value) -> bool:
     if isinstance(value, (int, float)):
         return True
@@ -604,7 +700,7 @@ def _is_numeric_like(value) -> bool:
         stripped = value.strip()
         if stripped == "":
             return False
-        return re.fullmatch(r"[-+]?\d+(\.\d+)?", stripped) is not None
+        return _NUMERIC_RE.fullmatch(stripped) is not None
     return False
 
 def _normalize_int_like(value):
@@ -620,15 +716,22 @@ def _normalize_int_like(value):
         stripped = value.strip()
         if stripped == "":
             return None
-        if re.fullmatch(r"[-+]?\d+", stripped):
+        if _INT_RE.fullmatch(stripped):
             return int(stripped)
-        if re.fullmatch(r"[-+]?\d+\.0+", stripped):
+        if _INT_WITH_ZERO_FRACTION_RE.fullmatch(stripped):
             return int(float(stripped))
     return value
 
 
-def apply_to_workbook(final_obj, template_xlsx, out_xlsx, excel_map, clear_existing_data=False):
-    wb = openpyxl.load_workbook(template_xlsx)
+def apply_to_workbook(final_obj, template_xlsx, out_xlsx, excel_map, clear_existing_data=False, wb=None):
+    """Write final_obj into the workbook, save it to out_xlsx and return it.
+
+    Pass the workbook returned by a previous call as wb to keep writing to it
+    instead of re-loading out_xlsx for every paper.
+    """
+    if wb is None:
+        # External links are never used by the template; skip loading them.
+        wb = openpyxl.load_workbook(template_xlsx, keep_links=False)
 
     # Clear old/demo data rows if requested (typically on first PDF only)
     if clear_existing_data:
@@ -641,6 +744,7 @@ def apply_to_workbook(final_obj, template_xlsx, out_xlsx, excel_map, clear_exist
     anchor_row = _resolve_anchor_row(wb, pmid)
 
     row_by_sheet = {}
+    column_plans = _EXCEL_COLUMN_PLANS if excel_map is EXCEL_MAP else _build_column_plans(excel_map)
 
     def write_sheet(sheet_key):
         sheet_name = (excel_map.get("sheet_key_to_name") or {}).get(sheet_key)
@@ -657,32 +761,33 @@ def apply_to_workbook(final_obj, template_xlsx, out_xlsx, excel_map, clear_exist
         if row_idx is None:
             row_idx = max(anchor_row, start_row)
 
-        cols = sheet_cfg.get("columns") or {}
+        cols = column_plans.get(sheet_key) or {}
         payload = sheets_data.get(sheet_key)
 
         # Write PMID only for sheets we actually populate (or always for Included Articles / Level of Evidence).
         if "pmid" in cols:
-            ws[f"{cols['pmid']}{row_idx}"].value = pmid
+            ws.cell(row_idx, cols["pmid"]).value = pmid
 
         if isinstance(payload, dict):
-            for field, col_letter in cols.items():
+            for field, col_idx in cols.items():
                 if field == "pmid":
                     continue
-                if field in payload:
-                    v = payload.get(field)
-                    if v is None:
-                        continue
-                    if field in INTEGER_COUNT_FIELDS:
-                        v = _normalize_int_like(v)
-                    ws[f"{col_letter}{row_idx}"].value = normalize_excel_value(v)
+                v = payload.get(field)
+                if v is None:
+                    continue
+                if field in INTEGER_COUNT_FIELDS:
+                    v = _normalize_int_like(v)
+                ws.cell(row_idx, col_idx).value = normalize_excel_value(v)
 
         # Back-fill author/year/study_design from Included Articles if available and blank.
         inc = sheets_data.get("included_articles") or {}
         if isinstance(inc, dict):
             for f in ("author", "year", "study_design"):
-                if f in cols and ws[f"{cols[f]}{row_idx}"].value in (None, ""):
-                    if inc.get(f) not in (None, ""):
-                        ws[f"{cols[f]}{row_idx}"].value = normalize_excel_value(inc.get(f))
+                if f not in cols:
+                    continue
+                cell = ws.cell(row_idx, cols[f])
+                if cell.value in (None, "") and inc.get(f) not in (None, ""):
+                    cell.value = normalize_excel_value(inc.get(f))
         return row_idx
 
     # Always write these two sheets (even if sparse): boss deliverable tables.
@@ -737,15 +842,13 @@ def apply_to_workbook(final_obj, template_xlsx, out_xlsx, excel_map, clear_exist
         row_idx = row_by_sheet.get(sheet_key)
         if not row_idx:
             continue
-        sheet_cfg = (excel_map.get("sheets") or {}).get(sheet_key) or {}
-        cols = sheet_cfg.get("columns") or {}
-        col_letter = cols.get(field)
-        if not col_letter:
+        col_idx = (column_plans.get(sheet_key) or {}).get(field)
+        if not col_idx:
             continue
-        ws = wb[sheet_name]
-        ws[f"{col_letter}{row_idx}"].fill = _fill_for_severity(severity)
+        wb[sheet_name].cell(row_idx, col_idx).fill = _fill_for_severity(severity)
 
     wb.save(out_xlsx)
+    return wb
 
 
 
@@ -759,49 +862,71 @@ def _is_yes(v):
         return v.strip() == "Yes"
     return False
 
+# Jadad points per answer token; anything else scores 0.
+_JADAD_ITEM_POINTS = {"1": 1}
+_JADAD_METHOD_POINTS = {"+1": 1, "-1": -1}
+
+def _score_token(v):
+    # Same token as str(v).strip(), without the str() round-trip for strings.
+    return v.strip() if isinstance(v, str) else str(v)
+
+def _count_yes_answers(sheet):
+    # One pass over the q* columns, reading values straight from items().
+    return sum(1 for k, v in sheet.items() if k.startswith("q") and _is_yes(v))
+
 def compute_scores_inplace(final_obj):
     sheets = (final_obj.get("record") or {}).get("sheets") or {}
 
     # Jadad-like scoring for RCT sheet.
     rct = sheets.get("rct_appraisal")
     if isinstance(rct, dict):
-        total = 0
-        for k in ("q1_randomized", "q3_double_blind", "q5_withdrawals_dropouts"):
-            if str(rct.get(k)).strip() == "1":
-                total += 1
-        for k in ("q2_randomization_method", "q4_blinding_method"):
-            vv = str(rct.get(k)).strip()
-            if vv == "+1":
-                total += 1
-            elif vv == "-1":
-                total -= 1
-        rct["total_score"] = max(0, int(total))
+        total = (
+            _JADAD_ITEM_POINTS.get(_score_token(rct.get("q1_randomized")), 0)
+            + _JADAD_ITEM_POINTS.get(_score_token(rct.get("q3_double_blind")), 0)
+            + _JADAD_ITEM_POINTS.get(_score_token(rct.get("q5_withdrawals_dropouts")), 0)
+            + _JADAD_METHOD_POINTS.get(_score_token(rct.get("q2_randomization_method")), 0)
+            + _JADAD_METHOD_POINTS.get(_score_token(rct.get("q4_blinding_method")), 0)
+        )
+        rct["total_score"] = max(0, total)
 
     # Case series: count Yes across 10 questions.
     cs = sheets.get("case_series_appraisal")
     if isinstance(cs, dict):
-        q_keys = [k for k in cs.keys() if k.startswith("q")]
-        total = sum(1 for k in q_keys if _is_yes(cs.get(k)))
-        cs["total_score"] = int(total)
+        cs["total_score"] = _count_yes_answers(cs)
 
     # Systematic: count Yes across q* columns (including the combined q4_6 as one column).
     sr = sheets.get("systematic_appraisal")
     if isinstance(sr, dict):
-        q_keys = [k for k in sr.keys() if k.startswith("q")]
-        total = sum(1 for k in q_keys if _is_yes(sr.get(k)))
-        sr["total_score"] = int(total)
+        sr["total_score"] = _count_yes_answers(sr)
 
 
 # -------------------------
 # PDF TEXT (page-aware)
 # -------------------------
 def extract_pdf_pages(pdf_path):
-    doc = fitz.open(pdf_path)
+    # TextPage.extractText() with get_text("text")'s flags gives the same text without
+    # the per-call option handling. PyMuPDF is not thread-safe, so pages stay sequential.
     pages = []
-    for i in range(doc.page_count):
-        txt = doc.load_page(i).get_text("text")
-        pages.append({"page_index": i, "text": txt or ""})
-    doc.close()
+    with fitz.open(pdf_path) as doc:
+        for i, page in enumerate(doc):
+            txt = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT).extractText()
+            pages.append({"page_index": i, "text": txt or ""})
+    return pages
+
+# Part of the page-text cache key; bump it whenever extract_pdf_pages changes its output.
+_PDF_PAGES_CACHE_VERSION = f"textpage-flags{fitz.TEXTFLAGS_TEXT}-pymupdf{fitz.VersionBind}"
+
+def load_pdf_pages(pdf_path):
+    """extract_pdf_pages, reusing cached page text keyed by the PDF bytes when LLM_CACHE_DIR is set."""
+    cache = _get_llm_cache()
+    if cache is None:
+        return extract_pdf_pages(pdf_path)
+    with open(pdf_path, "rb") as f:
+        cache_key = ExtractionCache.make_key("pdf_pages", _PDF_PAGES_CACHE_VERSION, f.read())
+    pages = cache.get(cache_key)
+    if not isinstance(pages, list):
+        pages = extract_pdf_pages(pdf_path)
+        cache.set(cache_key, pages)
     return pages
 
 DOI_REGEX = re.compile(r"\b10\.\d{4,9}/[^\s\"<>]+", re.IGNORECASE)
@@ -815,10 +940,14 @@ TITLE_STOPWORDS = {
     "journal",
     "doi",
 }
+# One alternation scan per line instead of a substring search per stopword.
+_TITLE_STOPWORDS_RE = re.compile("|".join(re.escape(w) for w in sorted(TITLE_STOPWORDS)))
+
+DOI_PREFIX_RE = re.compile(r"^(doi\s*:\s*)", re.IGNORECASE)
 
 def _normalize_doi(doi: str) -> str:
     doi = doi.strip()
-    doi = re.sub(r"^(doi\s*:\s*)", "", doi, flags=re.IGNORECASE)
+    doi = DOI_PREFIX_RE.sub("", doi)
     return doi.rstrip(").,;")
 
 def _extract_doi(text: str) -> Optional[str]:
@@ -832,24 +961,24 @@ def _extract_doi(text: str) -> Optional[str]:
 def _extract_title_from_page(text: str) -> Optional[str]:
     if not text:
         return None
-    candidates = []
+    # Best line by (word count, length, text); a running max instead of sorting every candidate.
+    best = None
     for raw in text.splitlines():
         line = raw.strip()
         if not line:
             continue
-        lower = line.lower()
-        if any(stop in lower for stop in TITLE_STOPWORDS):
-            continue
-        if sum(ch.isdigit() for ch in line) > 3:
-            continue
+        # Cheapest filter first: most lines fail the word-count window.
         words = line.split()
         if not (5 <= len(words) <= 25):
             continue
-        candidates.append((len(words), len(line), line))
-    if not candidates:
-        return None
-    candidates.sort(reverse=True)
-    return candidates[0][2]
+        if _TITLE_STOPWORDS_RE.search(line.lower()):
+            continue
+        if sum(map(str.isdigit, line)) > 3:
+            continue
+        candidate = (len(words), len(line), line)
+        if best is None or candidate > best:
+            best = candidate
+    return best[2] if best is not None else None
 
 def extract_paper_id_from_pages(pages: list[dict]) -> dict:
     if not pages:
@@ -860,16 +989,34 @@ def extract_paper_id_from_pages(pages: list[dict]) -> dict:
     title = _extract_title_from_page(first_pages[0].get("text", ""))
     return {"doi": doi, "title": title}
 
+_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
 def _clean_text(t):
-    t = re.sub(r"[ \t]+\n", "\n", t)
-    t = re.sub(r"\n{3,}", "\n\n", t)
-    return t
+    return _MULTI_NEWLINE_RE.sub("\n\n", _TRAILING_WS_RE.sub("\n", t))
+
+def _drop_repeated_paragraphs(text):
+    # Long paragraphs repeated verbatim (licence notices, per-page boilerplate) are sent once.
+    if FULL_VIEW_DEDUP_MIN_CHARS <= 0:
+        return text
+    seen = set()
+    out = []
+    for para in text.split("\n\n"):
+        if len(para) >= FULL_VIEW_DEDUP_MIN_CHARS:
+            if para in seen:
+                continue
+            seen.add(para)
+        out.append(para)
+    return "\n\n".join(out)
 
 def make_full_view(pages):
     full = "\n".join([p["text"] for p in pages])
-    return _clean_text(full)
+    return _drop_repeated_paragraphs(_clean_text(full))
 
-def build_verifier_view(pages, decisions):
+def build_verifier_view(pages, decisions, full_view=None):
+    # The verifier sees the whole paper; reuse the per-PDF view when the caller has it.
+    if full_view is not None:
+        return full_view
     return make_full_view(pages)
 
 
@@ -882,12 +1029,13 @@ def _int_or_string_schema():
 def _number_or_string_schema():
     return {"type": ["number", "string", "null"]}
 
+@lru_cache(maxsize=1)
 def _sheet_schema_included_articles_partial():
     props = {
         "pmid": {"type": ["integer", "null"]},
         "author": {"type": ["string", "null"]},
         "year": _int_or_string_schema(),
-        "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
+        "study_design": _STUDY_DESIGN_SCHEMA,
         "n_pts": _int_or_string_schema(),
         "age_mean_years": _number_or_string_schema(),
         "gender_male_n": _int_or_string_schema(),
@@ -930,17 +1078,26 @@ def _sheet_schema_included_articles_partial():
     }
     return {"type": "object", "additionalProperties": False, "required": list(props.keys()), "properties": props}
 
+@lru_cache(maxsize=1)
 def _sheet_schema_level_of_evidence_partial():
     props = {
         "pmid": {"type": ["integer", "null"]},
         "author": {"type": ["string", "null"]},
         "year": _int_or_string_schema(),
-        "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
+        "study_design": _STUDY_DESIGN_SCHEMA,
         "level_of_evidence": {"type": ["string", "null"]},
         "grade_of_recommendation": {"type": ["string", "null"]},
     }
     return {"type": "object", "additionalProperties": False, "required": list(props.keys()), "properties": props}
 
+def _sheet_object_schema(props):
+    # Strict mode: every property is listed as required (unchanged values are sent as null).
+    return {"type": "object", "additionalProperties": False, "required": list(props.keys()), "properties": props}
+
+# Built once; every sheet schema below shares these property dicts and must not mutate them.
+_INC_BASE_PROPS = _sheet_schema_included_articles_partial()["properties"]
+_LEV_BASE_PROPS = _sheet_schema_level_of_evidence_partial()["properties"]
+
 DECISION_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
@@ -967,36 +1124,34 @@ PAPER_ID_SCHEMA = {
 
 STUDY_TYPE_ENUM = ["rct", "cohort", "case_series", "case_control", "systematic_review", "other", "unclear"]
 
-def build_task_schema(task_name, allowed_sheet_key=None, allowed_included_keys=None, allowed_level_keys=None):
-    # Schema restricts patch to only the sheet/fields for this task.
-    inc_schema = _sheet_schema_included_articles_partial()
-    lev_schema = _sheet_schema_level_of_evidence_partial()
-
-    # If allowed_included_keys provided, shrink properties to only those keys.
-    if allowed_included_keys is not None:
-        inc_schema = copy.deepcopy(inc_schema)
-        inc_schema["properties"] = {k: v for k, v in inc_schema["properties"].items() if k in allowed_included_keys}
-        inc_schema["required"] = list(inc_schema["properties"].keys())
+_DECISIONS_ARRAY_SCHEMA = {"type": "array", "items": DECISION_SCHEMA}
+_CONFIDENCE_SCHEMA = {"type": "number", "minimum": 0.0, "maximum": 1.0}
+_NOTES_SCHEMA = {"type": "string"}
+_STUDY_TYPE_SCHEMA = {"type": ["string", "null"], "enum": STUDY_TYPE_ENUM + [None]}
 
-    if allowed_level_keys is not None:
-        lev_schema = copy.deepcopy(lev_schema)
-        lev_schema["properties"] = {k: v for k, v in lev_schema["properties"].items() if k in allowed_level_keys}
-        lev_schema["required"] = list(lev_schema["properties"].keys())
+def _task_result_schema(patch_props, sheets_props):
+    """Outer envelope shared by task and appraisal results; only the patch contents vary.
 
-    sheets_props = {}
-    if allowed_sheet_key == "included_articles":
-        sheets_props["included_articles"] = inc_schema
-    elif allowed_sheet_key == "level_of_evidence":
-        sheets_props["level_of_evidence"] = lev_schema
-    else:
-        # allow both by default
-        sheets_props["included_articles"] = inc_schema
-        sheets_props["level_of_evidence"] = lev_schema
-
-    for sheet_schema in sheets_props.values():
-        sheet_schema["required"] = list(sheet_schema.get("properties", {}).keys())
-
-    schema = {
+    patch_props are the patch's own fields; a record/sheets object built from
+    sheets_props is appended to them.
+    """
+    patch_props = {
+        **patch_props,
+        "record": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["sheets"],
+            "properties": {
+                "sheets": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "required": list(sheets_props.keys()),
+                    "properties": sheets_props,
+                }
+            },
+        },
+    }
+    return {
         "type": "object",
         "additionalProperties": False,
         "required": ["patch", "decisions", "confidence", "notes"],
@@ -1004,187 +1159,144 @@ def build_task_schema(task_name, allowed_sheet_key=None, allowed_included_keys=N
             "patch": {
                 "type": "object",
                 "additionalProperties": False,
-                "required": ["paper_id", "study_type", "record"],
-                "properties": {
-                    "paper_id": PAPER_ID_SCHEMA,
-                    "study_type": {"type": ["string", "null"], "enum": STUDY_TYPE_ENUM + [None]},
-                    "record": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "required": ["sheets"],
-                        "properties": {
-                            "sheets": {
-                                "type": "object",
-                                "additionalProperties": False,
-                                "required": list(sheets_props.keys()),
-                                "properties": sheets_props,
-                            }
-                        },
-                    },
-                },
+                "required": list(patch_props.keys()),
+                "properties": patch_props,
             },
-            "decisions": {"type": "array", "items": DECISION_SCHEMA},
-            "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
-            "notes": {"type": "string"},
+            "decisions": _DECISIONS_ARRAY_SCHEMA,
+            "confidence": _CONFIDENCE_SCHEMA,
+            "notes": _NOTES_SCHEMA,
         },
     }
-    return schema
 
-def build_appraisal_schema(study_type):
-    # Each appraisal task schema only allows the relevant appraisal sheet keys.
-    # All answers should be strings matching the Excel validation lists where present.
-    def y_schema():
-        return {"type": ["string", "null"], "enum": APPRAISAL_YNUA_ENUM + [None]}
+def build_task_schema(task_name, allowed_sheet_key=None, allowed_included_keys=None, allowed_level_keys=None):
+    # The (task, allowed keys) combinations are fixed, so each schema is built once.
+    # Callers share the cached dict and must treat it as read-only.
+    return _build_task_schema_cached(
+        task_name,
+        allowed_sheet_key,
+        None if allowed_included_keys is None else frozenset(allowed_included_keys),
+        None if allowed_level_keys is None else frozenset(allowed_level_keys),
+    )
 
-    sheets = {}
+@lru_cache(maxsize=None)
+def _build_task_schema_cached(task_name, allowed_sheet_key, allowed_included_keys, allowed_level_keys):
+    # Schema restricts patch to only the sheet/fields for this task.
+    inc_props = _INC_BASE_PROPS
+    lev_props = _LEV_BASE_PROPS
+    # If allowed_*_keys provided, shrink properties to only those keys.
+    if allowed_included_keys is not None:
+        inc_props = {k: v for k, v in inc_props.items() if k in allowed_included_keys}
+    if allowed_level_keys is not None:
+        lev_props = {k: v for k, v in lev_props.items() if k in allowed_level_keys}
 
-    if study_type == "rct":
-        sheets["rct_appraisal"] = {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "pmid": {"type": ["integer", "null"]},
-                "author": {"type": ["string", "null"]},
-                "year": _int_or_string_schema(),
-                "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-                "q1_randomized": {"type": ["string", "null"], "enum": ["0", "1", None]},
-                "q2_randomization_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
-                "q3_double_blind": {"type": ["string", "null"], "enum": ["0", "1", None]},
-                "q4_blinding_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
-                "q5_withdrawals_dropouts": {"type": ["string", "null"], "enum": ["0", "1", None]},
-                "total_score": _int_or_string_schema(),
-            },
-        }
-    elif study_type == "cohort":
-        sheets["cohort_appraisal"] = {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "pmid": {"type": ["integer", "null"]},
-                "author": {"type": ["string", "null"]},
-                "year": _int_or_string_schema(),
-                "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-                "q1_groups_similar": y_schema(),
-                "q2_exposures_measured_similarly": y_schema(),
-                "q3_exposure_valid_reliable": y_schema(),
-                "q4_confounders_identified": y_schema(),
-                "q5_confounders_addressed": y_schema(),
-                "q6_free_of_outcome_at_start": y_schema(),
-                "q7_outcomes_valid_reliable": y_schema(),
-                "q8_followup_sufficient": y_schema(),
-                "q9_followup_complete": y_schema(),
-                "q10_address_incomplete_followup": y_schema(),
-                "q11_appropriate_statistics": y_schema(),
-            },
-        }
-    elif study_type == "case_series":
-        sheets["case_series_appraisal"] = {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "pmid": {"type": ["integer", "null"]},
-                "author": {"type": ["string", "null"]},
-                "year": _int_or_string_schema(),
-                "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-                "q1_inclusion_criteria_clear": y_schema(),
-                "q2_condition_measured_standard": y_schema(),
-                "q3_valid_identification_methods": y_schema(),
-                "q4_consecutive_inclusion": y_schema(),
-                "q5_complete_inclusion": y_schema(),
-                "q6_demographics_reported": y_schema(),
-                "q7_clinical_info_reported": y_schema(),
-                "q8_outcomes_followup_reported": y_schema(),
-                "q9_presenting_site_reported": y_schema(),
-                "q10_statistics_appropriate": y_schema(),
-                "total_score": _int_or_string_schema(),
-            },
-        }
-    elif study_type == "case_control":
-        sheets["case_control_appraisal"] = {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "pmid": {"type": ["integer", "null"]},
-                "author": {"type": ["string", "null"]},
-                "year": _int_or_string_schema(),
-                "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-                "q1_groups_comparable": y_schema(),
-                "q2_matched_appropriately": y_schema(),
-                "q3_same_criteria_cases_controls": y_schema(),
-                "q4_exposure_valid_reliable": y_schema(),
-                "q5_exposure_measured_same_way": y_schema(),
-                "q6_confounders_identified": y_schema(),
-                "q7_confounders_addressed": y_schema(),
-                "q8_outcomes_assessed_standard": y_schema(),
-                "q9_exposure_period_long_enough": y_schema(),
-                "q10_appropriate_statistics": y_schema(),
-            },
-        }
-    elif study_type == "systematic_review":
-        sheets["systematic_appraisal"] = {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "pmid": {"type": ["integer", "null"]},
-                "author": {"type": ["string", "null"]},
-                "year": _int_or_string_schema(),
-                "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-                "q1_pico": y_schema(),
-                "q2_protocol_predefined": y_schema(),
-                "q3_designs_explained": y_schema(),
-                "q4_6_search_and_duplicates": y_schema(),
-                "q7_excluded_list": y_schema(),
-                "q8_included_described": y_schema(),
-                "q9_risk_of_bias": y_schema(),
-                "q10_funding_sources": y_schema(),
-                "q11_meta_analysis_methods": y_schema(),
-                "q12_impact_of_rob": y_schema(),
-                "q13_account_for_rob": y_schema(),
-                "q14_heterogeneity_explained": y_schema(),
-                "q15_publication_bias": y_schema(),
-                "q16_conflicts_reported": y_schema(),
-                "total_score": _int_or_string_schema(),
-            },
-        }
+    sheets_props = {}
+    if allowed_sheet_key == "included_articles":
+        sheets_props["included_articles"] = _sheet_object_schema(inc_props)
+    elif allowed_sheet_key == "level_of_evidence":
+        sheets_props["level_of_evidence"] = _sheet_object_schema(lev_props)
     else:
-        sheets = {}
+        # allow both by default
+        sheets_props["included_articles"] = _sheet_object_schema(inc_props)
+        sheets_props["level_of_evidence"] = _sheet_object_schema(lev_props)
 
-    for sheet_schema in sheets.values():
-        sheet_schema["required"] = list(sheet_schema.get("properties", {}).keys())
+    return _task_result_schema({"paper_id": PAPER_ID_SCHEMA, "study_type": _STUDY_TYPE_SCHEMA}, sheets_props)
 
-    return {
-        "type": "object",
-        "additionalProperties": False,
-        "required": ["patch", "decisions", "confidence", "notes"],
-        "properties": {
-            "patch": {
-                "type": "object",
-                "additionalProperties": False,
-                "required": ["record"],
-                "properties": {
-                    "record": {
-                        "type": "object",
-                        "additionalProperties": False,
-                        "required": ["sheets"],
-                        "properties": {
-                            "sheets": {
-                                "type": "object",
-                                "additionalProperties": False,
-                                "required": list(sheets.keys()),
-                                "properties": sheets,
-                            }
-                        },
-                    },
-                },
-            },
-            "decisions": {"type": "array", "items": DECISION_SCHEMA},
-            "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
-            "notes": {"type": "string"},
-        },
-    }
+# Identification columns shared by every appraisal sheet.
+_APPRAISAL_ID_PROPS = {
+    "pmid": {"type": ["integer", "null"]},
+    "author": {"type": ["string", "null"]},
+    "year": _int_or_string_schema(),
+    "study_design": _STUDY_DESIGN_SCHEMA,
+}
+
+# Scored questions per study type, in template column order.
+APPRAISAL_QUESTION_KEYS = {
+    "rct": ["q1_randomized", "q2_randomization_method", "q3_double_blind", "q4_blinding_method", "q5_withdrawals_dropouts"],
+    "cohort": [
+        "q1_groups_similar", "q2_exposures_measured_similarly", "q3_exposure_valid_reliable",
+        "q4_confounders_identified", "q5_confounders_addressed", "q6_free_of_outcome_at_start",
+        "q7_outcomes_valid_reliable", "q8_followup_sufficient", "q9_followup_complete",
+        "q10_address_incomplete_followup", "q11_appropriate_statistics",
+    ],
+    "case_series": [
+        "q1_inclusion_criteria_clear", "q2_condition_measured_standard", "q3_valid_identification_methods",
+        "q4_consecutive_inclusion", "q5_complete_inclusion", "q6_demographics_reported",
+        "q7_clinical_info_reported", "q8_outcomes_followup_reported", "q9_presenting_site_reported",
+        "q10_statistics_appropriate",
+    ],
+    "case_control": [
+        "q1_groups_comparable", "q2_matched_appropriately", "q3_same_criteria_cases_controls",
+        "q4_exposure_valid_reliable", "q5_exposure_measured_same_way", "q6_confounders_identified",
+        "q7_confounders_addressed", "q8_outcomes_assessed_standard", "q9_exposure_period_long_enough",
+        "q10_appropriate_statistics",
+    ],
+    "systematic_review": [
+        "q1_pico", "q2_protocol_predefined", "q3_designs_explained", "q4_6_search_and_duplicates",
+        "q7_excluded_list", "q8_included_described", "q9_risk_of_bias", "q10_funding_sources",
+        "q11_meta_analysis_methods", "q12_impact_of_rob", "q13_account_for_rob",
+        "q14_heterogeneity_explained", "q15_publication_bias", "q16_conflicts_reported",
+    ],
+}
+
+# Property schemas per appraisal sheet, built once and shared (read-only) by the
+# appraisal task schemas and the verifier's suggested_patch schema.
+_APPRAISAL_SHEET_PROPS = {
+    "rct_appraisal": {
+        **_APPRAISAL_ID_PROPS,
+        "q1_randomized": {"type": ["string", "null"], "enum": ["0", "1", None]},
+        "q2_randomization_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
+        "q3_double_blind": {"type": ["string", "null"], "enum": ["0", "1", None]},
+        "q4_blinding_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
+        "q5_withdrawals_dropouts": {"type": ["string", "null"], "enum": ["0", "1", None]},
+        "total_score": _int_or_string_schema(),
+    },
+    "cohort_appraisal": {
+        **_APPRAISAL_ID_PROPS,
+        **{k: _YNUA_SCHEMA for k in APPRAISAL_QUESTION_KEYS["cohort"]},
+    },
+    "case_series_appraisal": {
+        **_APPRAISAL_ID_PROPS,
+        **{k: _YNUA_SCHEMA for k in APPRAISAL_QUESTION_KEYS["case_series"]},
+        "total_score": _int_or_string_schema(),
+    },
+    "case_control_appraisal": {
+        **_APPRAISAL_ID_PROPS,
+        **{k: _YNUA_SCHEMA for k in APPRAISAL_QUESTION_KEYS["case_control"]},
+    },
+    "systematic_appraisal": {
+        **_APPRAISAL_ID_PROPS,
+        **{k: _YNUA_SCHEMA for k in APPRAISAL_QUESTION_KEYS["systematic_review"]},
+        "total_score": _int_or_string_schema(),
+    },
+}
+
+_APPRAISAL_SHEET_BY_STUDY_TYPE = {
+    "rct": "rct_appraisal",
+    "cohort": "cohort_appraisal",
+    "case_series": "case_series_appraisal",
+    "case_control": "case_control_appraisal",
+    "systematic_review": "systematic_appraisal",
+}
+
+@lru_cache(maxsize=None)
+def build_appraisal_schema(study_type):
+    # Cached per study_type; callers share the dict and must not mutate it.
+    # Each appraisal task schema only allows the relevant appraisal sheet keys.
+    # All answers should be strings matching the Excel validation lists where present.
+    sheet_key = _APPRAISAL_SHEET_BY_STUDY_TYPE.get(study_type)
+    sheets = {sheet_key: _sheet_object_schema(_APPRAISAL_SHEET_PROPS[sheet_key])} if sheet_key else {}
+
+    return _task_result_schema({}, sheets)
 
 def build_appraisal_schema_subset(study_type, allowed_keys):
-    schema = build_appraisal_schema(study_type)
+    return _build_appraisal_schema_subset_cached(
+        study_type, None if allowed_keys is None else frozenset(allowed_keys)
+    )
+
+@lru_cache(maxsize=None)
+def _build_appraisal_schema_subset_cached(study_type, allowed_keys):
+    # Narrow a private copy so the cached full schema stays intact.
+    schema = clone_json(build_appraisal_schema(study_type))
     sheets_schema = (schema.get("properties") or {}).get("patch", {}).get("properties", {}).get("record", {}).get("properties", {}).get("sheets", {})
     sheet_props = (sheets_schema or {}).get("properties", {})
     if not sheet_props:
@@ -1207,6 +1319,7 @@ def _optionalize_object_schema(s: dict) -> dict:
     return s2
 
 
+@lru_cache(maxsize=1)
 def _suggested_patch_schema():
     """
     suggested_patch is ALWAYS an object (never null) so we avoid object|null unions
@@ -1214,10 +1327,9 @@ def _suggested_patch_schema():
 
     In strict mode, every object must have required lists that include every property.
     The verifier should set unchanged fields to null and corrected fields to non-null.
-    """
-    def y_schema():
-        return {"type": ["string", "null"], "enum": APPRAISAL_YNUA_ENUM + [None]}
 
+    Built once; the result is shared and must be treated as read-only.
+    """
     paper_id_obj = {
         "type": "object",
         "additionalProperties": False,
@@ -1229,124 +1341,8 @@ def _suggested_patch_schema():
         },
     }
 
-    included_articles_obj = copy.deepcopy(_sheet_schema_included_articles_partial())
-    included_articles_obj["required"] = list(included_articles_obj.get("properties", {}).keys())
-
-    level_of_evidence_obj = copy.deepcopy(_sheet_schema_level_of_evidence_partial())
-    level_of_evidence_obj["required"] = list(level_of_evidence_obj.get("properties", {}).keys())
-
-    rct_obj = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": [],
-        "properties": {
-            "pmid": {"type": ["integer", "null"]},
-            "author": {"type": ["string", "null"]},
-            "year": _int_or_string_schema(),
-            "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-            "q1_randomized": {"type": ["string", "null"], "enum": ["0", "1", None]},
-            "q2_randomization_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
-            "q3_double_blind": {"type": ["string", "null"], "enum": ["0", "1", None]},
-            "q4_blinding_method": {"type": ["string", "null"], "enum": ["-1", "0", "+1", None]},
-            "q5_withdrawals_dropouts": {"type": ["string", "null"], "enum": ["0", "1", None]},
-            "total_score": _int_or_string_schema(),
-        },
-    }
-
-    cohort_obj = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": [],
-        "properties": {
-            "pmid": {"type": ["integer", "null"]},
-            "author": {"type": ["string", "null"]},
-            "year": _int_or_string_schema(),
-            "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-            "q1_groups_similar": y_schema(),
-            "q2_exposures_measured_similarly": y_schema(),
-            "q3_exposure_valid_reliable": y_schema(),
-            "q4_confounders_identified": y_schema(),
-            "q5_confounders_addressed": y_schema(),
-            "q6_free_of_outcome_at_start": y_schema(),
-            "q7_outcomes_valid_reliable": y_schema(),
-            "q8_followup_sufficient": y_schema(),
-            "q9_followup_complete": y_schema(),
-            "q10_address_incomplete_followup": y_schema(),
-            "q11_appropriate_statistics": y_schema(),
-        },
-    }
-
-    case_series_obj = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": [],
-        "properties": {
-            "pmid": {"type": ["integer", "null"]},
-            "author": {"type": ["string", "null"]},
-            "year": _int_or_string_schema(),
-            "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-            "q1_inclusion_criteria_clear": y_schema(),
-            "q2_condition_measured_standard": y_schema(),
-            "q3_valid_identification_methods": y_schema(),
-            "q4_consecutive_inclusion": y_schema(),
-            "q5_complete_inclusion": y_schema(),
-            "q6_demographics_reported": y_schema(),
-            "q7_clinical_info_reported": y_schema(),
-            "q8_outcomes_followup_reported": y_schema(),
-            "q9_presenting_site_reported": y_schema(),
-            "q10_statistics_appropriate": y_schema(),
-            "total_score": _int_or_string_schema(),
-        },
-    }
-
-    case_control_obj = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": [],
-        "properties": {
-            "pmid": {"type": ["integer", "null"]},
-            "author": {"type": ["string", "null"]},
-            "year": _int_or_string_schema(),
-            "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-            "q1_groups_comparable": y_schema(),
-            "q2_matched_appropriately": y_schema(),
-            "q3_same_criteria_cases_controls": y_schema(),
-            "q4_exposure_valid_reliable": y_schema(),
-            "q5_exposure_measured_same_way": y_schema(),
-            "q6_confounders_identified": y_schema(),
-            "q7_confounders_addressed": y_schema(),
-            "q8_outcomes_assessed_standard": y_schema(),
-            "q9_exposure_period_long_enough": y_schema(),
-            "q10_appropriate_statistics": y_schema(),
-        },
-    }
-
-    systematic_obj = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": [],
-        "properties": {
-            "pmid": {"type": ["integer", "null"]},
-            "author": {"type": ["string", "null"]},
-            "year": _int_or_string_schema(),
-            "study_design": {"type": ["string", "null"], "enum": STUDY_DESIGN_ENUM + [None]},
-            "q1_pico": y_schema(),
-            "q2_protocol_predefined": y_schema(),
-            "q3_designs_explained": y_schema(),
-            "q4_6_search_and_duplicates": y_schema(),
-            "q7_excluded_list": y_schema(),
-            "q8_included_described": y_schema(),
-            "q9_risk_of_bias": y_schema(),
-            "q10_funding_sources": y_schema(),
-            "q11_meta_analysis_methods": y_schema(),
-            "q12_impact_of_rob": y_schema(),
-            "q13_account_for_rob": y_schema(),
-            "q14_heterogeneity_explained": y_schema(),
-            "q15_publication_bias": y_schema(),
-            "q16_conflicts_reported": y_schema(),
-            "total_score": _int_or_string_schema(),
-        },
-    }
+    included_articles_obj = _sheet_object_schema(_INC_BASE_PROPS)
+    level_of_evidence_obj = _sheet_object_schema(_LEV_BASE_PROPS)
 
     sheets_obj = {
         "type": "object",
@@ -1363,11 +1359,7 @@ def _suggested_patch_schema():
         "properties": {
             "included_articles": included_articles_obj,
             "level_of_evidence": level_of_evidence_obj,
-            "rct_appraisal": rct_obj,
-            "cohort_appraisal": cohort_obj,
-            "case_series_appraisal": case_series_obj,
-            "case_control_appraisal": case_control_obj,
-            "systematic_appraisal": systematic_obj,
+            **{k: _sheet_object_schema(props) for k, props in _APPRAISAL_SHEET_PROPS.items()},
         },
     }
 
@@ -1378,16 +1370,13 @@ def _suggested_patch_schema():
         "properties": {"sheets": sheets_obj},
     }
 
-    for sheet_schema in (rct_obj, cohort_obj, case_series_obj, case_control_obj, systematic_obj):
-        sheet_schema["required"] = list(sheet_schema.get("properties", {}).keys())
-
     return {
         "type": "object",
         "additionalProperties": False,
         "required": ["paper_id", "study_type", "record"],
         "properties": {
             "paper_id": paper_id_obj,
-            "study_type": {"type": ["string", "null"], "enum": STUDY_TYPE_ENUM + [None]},
+            "study_type": _STUDY_TYPE_SCHEMA,
             "record": record_obj,
         },
     }
@@ -1499,16 +1488,122 @@ def _task_user(task_name, allowed_fields_text, view_text, context_json=None):
     hints_text = _format_task_hints(task_name, hints)
     ctx = ""
     if context_json is not None:
-        ctx = "\n\nCONTEXT_JSON (already extracted; do not change unrelated fields):\n" + json.dumps(context_json, ensure_ascii=True)
+        if not isinstance(context_json, str):
+            context_json = dumps_json(context_json)
+        ctx = "\n\nCONTEXT_JSON (already extracted; do not change unrelated fields):\n" + context_json
+    # Paper text leads so all extraction tasks for a PDF share the same long prompt
+    # prefix, which the API can serve from its prompt cache.
     return (
+        f"PAPER_TEXT (TASK VIEW):\n{view_text}\n\n"
         f"TASK_NAME: {task_name}\n"
-        f"FIELDS_TO_FILL:\n{allowed_fields_text}\n\n"
-        f"PAPER_TEXT (TASK VIEW):\n{view_text}\n"
+        f"FIELDS_TO_FILL:\n{allowed_fields_text}\n"
         + hints_text
         + ctx
     )
 
 
+# -------------------------
+# EXTRACTION TASKS
+# -------------------------
+_TASK1_CONFIG = {
+    "task_num": "1/5", "task_name": "meta_design",
+    "allowed_keys": ["author", "year", "study_design"],
+    "sheet_key": None,
+    "allowed_level_keys": ["level_of_evidence", "grade_of_recommendation"],
+    "schema_name": "mronj_task_meta_design",
+    "fields_text": (
+        "EXTRACT these fields:\n"
+        "- paper_id: doi, title (from paper header/abstract); leave pmid null (resolved via PubMed)\n"
+        "- study_type: MUST be one of: " + "|".join(STUDY_TYPE_ENUM) + "\n"
+        "- included_articles.author: first author surname (e.g. 'Smith')\n"
+        "- included_articles.year: publication year as integer\n"
+        "- included_articles.study_design: brief description (e.g. 'Retrospective cohort')\n"
+        "- level_of_evidence.level_of_evidence: e.g. '1a', '2b', 'III' - only if explicitly stated\n"
+        "- level_of_evidence.grade_of_recommendation: e.g. 'A', 'B', 'C' - only if explicitly stated"
+    ),
+}
+
+_TASK2_CONFIG = {
+    "task_num": "2/5", "task_name": "population",
+    "allowed_keys": ["n_pts", "age_mean_years", "gender_male_n", "gender_female_n"],
+    "schema_name": "mronj_task_population",
+    "fields_text": (
+        "EXTRACT these fields from included_articles sheet:\n"
+        "- n_pts: total number of patients/participants as integer\n"
+        "- age_mean_years: mean age in years as number (e.g. 65.4)\n"
+        "- gender_male_n: number of male participants as integer\n"
+        "- gender_female_n: number of female participants as integer\n"
+        "NOTE: Leave paper_id and study_type as null (handled by another task)"
+    ),
+}
+
+_TASK3_CONFIG = {
+    "task_num": "3/5", "task_name": "indication_drugs_route_site",
+    "allowed_keys": [
+        "site_maxilla","site_mandible","site_both",
+        "primary_cause_breast_cancer","primary_cause_prostate_cancer","primary_cause_mm","primary_cause_osteoporosis","primary_cause_other",
+        "ards_bisphosphonates_zoledronate","ards_bisphosphonates_pamidronate","ards_bisphosphonates_risedronate","ards_bisphosphonates_alendronate",
+        "ards_bisphosphonates_ibandronate","ards_bisphosphonates_combination","ards_bisphosphonates_etidronate","ards_bisphosphonates_clodronate",
+        "ards_bisphosphonates_unknown_other","ards_denosumab","ards_both",
+        "route_iv","route_oral","route_im","route_subcutaneous","route_both","route_not_reported",
+    ],
+    "schema_name": "mronj_task_indication_drugs",
+    "fields_text": (
+        "EXTRACT these flags (1 if present, null if not mentioned) from included_articles sheet:\n"
+        "SITE (where MRONJ occurred):\n"
+        "- site_maxilla, site_mandible, site_both\n"
+        "PRIMARY CAUSE/INDICATION:\n"
+        "- primary_cause_breast_cancer, primary_cause_prostate_cancer, primary_cause_mm (multiple myeloma)\n"
+        "- primary_cause_osteoporosis, primary_cause_other\n"
+        "DRUGS - Bisphosphonates:\n"
+        "- ards_bisphosphonates_zoledronate (Zometa/Reclast)\n"
+        "- ards_bisphosphonates_pamidronate (Aredia)\n"
+        "- ards_bisphosphonates_alendronate (Fosamax)\n"
+        "- ards_bisphosphonates_risedronate (Actonel)\n"
+        "- ards_bisphosphonates_ibandronate (Boniva)\n"
+        "- ards_bisphosphonates_etidronate, ards_bisphosphonates_clodronate\n"
+        "- ards_bisphosphonates_combination (multiple BPs), ards_bisphosphonates_unknown_other\n"
+        "DRUGS - Other:\n"
+        "- ards_denosumab (Prolia/Xgeva), ards_both (BP + denosumab)\n"
+        "ROUTE of administration:\n"
+        "- route_iv, route_oral, route_im, route_subcutaneous, route_both, route_not_reported\n"
+        "NOTE: Leave paper_id and study_type as null (handled by another task)"
+    ),
+}
+
+_TASK4_CONFIG = {
+    "task_num": "4/5", "task_name": "intervention_outcomes",
+    "allowed_keys": [
+        "mronj_stage_at_risk","mronj_stage_0",
+        "prevention_technique","group_intervention","group_control",
+        "follow_up_mean_months","follow_up_range","outcome_variable","mronj_development","mronj_development_details",
+    ],
+    "schema_name": "mronj_task_outcomes",
+    "fields_text": (
+        "EXTRACT these fields from included_articles sheet:\n"
+        "STAGING:\n"
+        "- mronj_stage_at_risk: number of patients at risk stage (integer)\n"
+        "- mronj_stage_0: number of patients at stage 0 (integer)\n"
+        "INTERVENTION:\n"
+        "- prevention_technique: description of prevention method used\n"
+        "- group_intervention: description of intervention group\n"
+        "- group_control: description of control group\n"
+        "FOLLOW-UP:\n"
+        "- follow_up_mean_months: mean follow-up duration in months (number)\n"
+        "- follow_up_range: follow-up range as string (e.g. '6-24 months')\n"
+        "OUTCOMES:\n"
+        "- outcome_variable: primary outcome measured\n"
+        "- mronj_development: 'Yes' or 'No' - did MRONJ develop?\n"
+        "- mronj_development_details: details about MRONJ cases if any\n"
+        "NOTE: Leave paper_id and study_type as null (handled by another task)"
+    ),
+}
+
+# Extraction tasks 1-4, run in parallel per PDF. Task 1 also returns the study_type
+# that selects the critical-appraisal schema (Task 5).
+EXTRACTION_TASKS = (_TASK1_CONFIG, _TASK2_CONFIG, _TASK3_CONFIG, _TASK4_CONFIG)
+
+
 # -------------------------
 # LLM CALLS
 # -------------------------
@@ -1522,39 +1617,115 @@ def _call_with_retries(fn, description):
             if attempt >= LLM_MAX_RETRIES:
                 break
             backoff = LLM_BACKOFF_SECONDS * (2 ** (attempt - 1))
-            jitter = random.uniform(0, LLM_BACKOFF_JITTER)
+            jitter = random.random() * LLM_BACKOFF_JITTER
             time.sleep(backoff + jitter)
     raise RuntimeError(f"{description} failed after {LLM_MAX_RETRIES} attempts: {last_exc}") from last_exc
 
-def openai_json(oai_client, system_text, user_text, schema, schema_name):
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+def get_openai_client(api_key):
+    """One OpenAI client per API key for the process, so repeated runs reuse its connection pool."""
+    with _openai_clients_lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = _openai_clients[api_key] = OpenAI(api_key=api_key)
+        return client
+
+_llm_caches = {}
+_llm_semaphores = {}
+_llm_semaphores_lock = threading.Lock()
+_schema_entries = {}
+
+_SCHEMA_VALIDATION_ERRORS = (jsonschema.ValidationError,) + (
+    (fastjsonschema.JsonSchemaValueException,) if fastjsonschema is not None else ()
+)
+
+def _compile_validator(schema):
+    """Callable that raises on data not matching schema; compiled by fastjsonschema when installed."""
+    if fastjsonschema is not None:
+        try:
+            return fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            pass
+    return jsonschema.validators.validator_for(schema)(schema).validate
+
+def _get_schema_entry(schema):
+    """Return (validate, canonical JSON text) for schema, built once per schema object.
+
+    Schema builders are cached, so identity is a stable key; the entry keeps a
+    reference to the schema so its id cannot be reused while cached.
+    """
+    entry = _schema_entries.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = (schema, _compile_validator(schema), dumps_json(schema, sort_keys=True))
+        _schema_entries[id(schema)] = entry
+    return entry[1], entry[2]
+
+def _get_llm_cache():
+    if not LLM_CACHE_DIR:
+        return None
+    cache = _llm_caches.get(LLM_CACHE_DIR)
+    if cache is None:
+        cache = _llm_caches[LLM_CACHE_DIR] = ExtractionCache(LLM_CACHE_DIR)
+    return cache
+
+def _get_llm_semaphore():
+    limit = max(1, int(LLM_MAX_CONCURRENT_CALLS))
+    with _llm_semaphores_lock:
+        sem = _llm_semaphores.get(limit)
+        if sem is None:
+            sem = _llm_semaphores[limit] = threading.BoundedSemaphore(limit)
+        return sem
+
+def _responses_json(oai_client, model, effort, system_text, user_text, schema, schema_name, description):
+    validate, schema_text = _get_schema_entry(schema)
+    cache = _get_llm_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = ExtractionCache.make_key(model, effort, schema_name, schema_text, system_text, user_text)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                validate(cached)
+                return cached
+            except _SCHEMA_VALIDATION_ERRORS:
+                cache.delete(cache_key)
+
+    semaphore = _get_llm_semaphore()
+
     def _call():
-        resp = oai_client.responses.create(
-            model=OPENAI_EXTRACT_MODEL,
-            reasoning={"effort": REASONING_EFFORT_OPENAI},
-            input=[
-                {"role": "system", "content": system_text},
-                {"role": "user", "content": user_text},
-            ],
-            text={"format": {"type": "json_schema", "name": schema_name, "schema": schema, "strict": True}},
-        )
-        return json.loads(resp.output_text)
-    return _call_with_retries(_call, f"OpenAI call ({schema_name})")
+        # Held only for the request itself, not during retry backoff.
+        with semaphore:
+            resp = oai_client.responses.create(
+                model=model,
+                reasoning={"effort": effort},
+                input=[
+                    {"role": "system", "content": system_text},
+                    {"role": "user", "content": user_text},
+                ],
+                text={"format": {"type": "json_schema", "name": schema_name, "schema": schema, "strict": True}},
+            )
+        result = loads_json(resp.output_text)
+        # Raising here lets _call_with_retries re-ask on a malformed response.
+        validate(result)
+        return result
+    result = _call_with_retries(_call, description)
+    if cache is not None:
+        cache.set(cache_key, result, model=model)
+    return result
+
+def openai_json(oai_client, system_text, user_text, schema, schema_name, reasoning_effort=None):
+    effort = reasoning_effort or REASONING_EFFORT_OPENAI
+    return _responses_json(oai_client, OPENAI_EXTRACT_MODEL, effort, system_text, user_text,
+                           schema, schema_name, f"OpenAI call ({schema_name})")
 
 
 # Verifier-specific LLM functions (use lower reasoning for faster verification)
 def openai_json_verifier(oai_client, system_text, user_text, schema, schema_name):
-    def _call():
-        resp = oai_client.responses.create(
-            model=OPENAI_VERIFIER_MODEL,
-            reasoning={"effort": VERIFIER_REASONING_EFFORT_OPENAI},
-            input=[
-                {"role": "system", "content": system_text},
-                {"role": "user", "content": user_text},
-            ],
-            text={"format": {"type": "json_schema", "name": schema_name, "schema": schema, "strict": True}},
-        )
-        return json.loads(resp.output_text)
-    return _call_with_retries(_call, f"OpenAI verifier ({schema_name})")
+    return _responses_json(oai_client, OPENAI_VERIFIER_MODEL, VERIFIER_REASONING_EFFORT_OPENAI,
+                           system_text, user_text, schema, schema_name,
+                           f"OpenAI verifier ({schema_name})")
 
 
 # -------------------------
@@ -1568,8 +1739,8 @@ def decisions_only_non_null(decisions):
         if d.get("page") is None and d.get("evidence"):
             extracted = extract_page_from_evidence(d.get("evidence"))
             if extracted is not None:
-                d = copy.deepcopy(d)
-                d["page"] = extracted
+                # Decisions are flat scalars, so a shallow copy keeps the caller's dict intact.
+                d = {**d, "page": extracted}
         out.append(d)
     return out
 
@@ -1587,13 +1758,11 @@ def group_decisions_by_page(decisions, max_chunk_size=VERIFIER_CHUNK_SIZE):
     # Group by page (None pages go together)
     by_page = {}
     for d in decisions:
-        page = d.get("page")
-        by_page.setdefault(page, []).append(d)
+        by_page.setdefault(d.get("page"), []).append(d)
 
     # Build chunks: try to keep same-page decisions together
     chunks = []
     current_chunk = []
-    current_pages = set()
 
     # Process decisions page by page, sorted by page number (None last)
     sorted_pages = sorted(by_page.keys(), key=lambda p: (p is None, p or 0))
@@ -1605,18 +1774,13 @@ def group_decisions_by_page(decisions, max_chunk_size=VERIFIER_CHUNK_SIZE):
         if current_chunk and len(current_chunk) + len(page_decisions) > max_chunk_size:
             chunks.append(current_chunk)
             current_chunk = []
-            current_pages = set()
 
         # Add decisions from this page (may need to split if too many on one page)
         for d in page_decisions:
             current_chunk.append(d)
-            if page is not None:
-                current_pages.add(page)
-
             if len(current_chunk) >= max_chunk_size:
                 chunks.append(current_chunk)
                 current_chunk = []
-                current_pages = set()
 
     # Don't forget the last chunk
     if current_chunk:
@@ -1628,10 +1792,13 @@ def group_decisions_by_page(decisions, max_chunk_size=VERIFIER_CHUNK_SIZE):
 # -------------------------
 # VALIDATION RULES (lightweight)
 # -------------------------
+ROUTE_FLAG_KEYS = ("route_iv", "route_oral", "route_im", "route_subcutaneous", "route_both")
+
 def rule_validation(final_obj):
     issues = []
     inc = (((final_obj.get("record") or {}).get("sheets")) or {}).get("included_articles") or {}
-    if not isinstance(inc, dict):
+    # No rule can fire on an empty row.
+    if not isinstance(inc, dict) or not inc:
         return issues
 
     def _is_empty(value):
@@ -1643,9 +1810,8 @@ def rule_validation(final_obj):
         issues.append({"severity": "WARN", "code": "MRONJ_DEV_UNEXPECTED", "message": "mronj_development should be Yes/No/blank to match template.", "path": "/record/sheets/included_articles/mronj_development"})
 
     # route_not_reported conflicts.
-    route_nr = inc.get("route_not_reported") == 1
-    route_any = any(inc.get(k) == 1 for k in ("route_iv", "route_oral", "route_im", "route_subcutaneous", "route_both"))
-    if route_nr and route_any:
+    # Other route flags only matter when route_not_reported is set.
+    if inc.get("route_not_reported") == 1 and any(inc.get(k) == 1 for k in ROUTE_FLAG_KEYS):
         issues.append({"severity": "WARN", "code": "ROUTE_NR_CONFLICT", "message": "route_not_reported is set but other route flags are also set.", "path": "/record/sheets/included_articles"})
 
     n_pts = inc.get("n_pts")
@@ -1690,13 +1856,14 @@ def rule_validation(final_obj):
 # VERIFIER (reviews only non-null decisions)
 # -------------------------
 def openai_verify_chunk(oai_client, view_text, driver_json, decisions_to_review):
+    # driver_json may be passed pre-serialized when several chunks share it.
     user_text = (
         "PAPER_TEXT (VIEW):\n"
         + view_text
         + "\n\nDRIVER_JSON (context):\n"
-        + json.dumps(driver_json, ensure_ascii=True)
+        + (driver_json if isinstance(driver_json, str) else dumps_json(driver_json))
         + "\n\nDECISIONS_TO_REVIEW:\n"
-        + json.dumps(decisions_to_review, ensure_ascii=True)
+        + dumps_json(decisions_to_review)
     )
     return openai_json_verifier(oai_client, VERIFIER_SYSTEM, user_text, VERIFIER_SCHEMA, "mronj_verifier_v2")
 
@@ -1704,7 +1871,12 @@ def openai_verify_chunk(oai_client, view_text, driver_json, decisions_to_review)
 # -------------------------
 # WORD REPORT
 # -------------------------
-def write_review_docx(final_obj, docx_path, append=True):
+def write_review_docx(final_obj, docx_path, append=True, doc=None):
+    """Append final_obj's review section to the log at docx_path and save it.
+
+    Pass the Document returned by a previous call as doc to keep appending to the
+    open document instead of re-reading the file for every paper.
+    """
     from docx.shared import Inches, Pt, RGBColor
     from docx.enum.table import WD_TABLE_ALIGNMENT
     from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -1712,6 +1884,15 @@ def write_review_docx(final_obj, docx_path, append=True):
     from docx.oxml import parse_xml
     import re
 
+    # Parsed once per call; each cell gets its own copy of the element.
+    shading_templates = {
+        fill: parse_xml(f'<w:shd {nsdecls("w")} w:fill="{fill}"/>')
+        for fill in ("D9E1F2", "C6EFCE", "FFC7CE", "FFEB9C")
+    }
+
+    def _shading(fill):
+        return copy.deepcopy(shading_templates[fill])
+
     def _sanitize_docx_text(value):
         if value is None:
             return ""
@@ -1719,7 +1900,9 @@ def write_review_docx(final_obj, docx_path, append=True):
             value = str(value)
         return sanitize_for_office(value)
 
-    if append and os.path.exists(docx_path):
+    if doc is not None:
+        doc.add_page_break()
+    elif append and os.path.exists(docx_path):
         doc = Document(docx_path)
         doc.add_page_break()
     else:
@@ -1795,31 +1978,43 @@ def write_review_docx(final_obj, docx_path, append=True):
                     run.bold = True
                     run.font.size = Pt(10)
             # Light blue background
-            shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="D9E1F2"/>')
-            cell._tc.get_or_add_tcPr().append(shading)
+            cell._tc.get_or_add_tcPr().append(_shading("D9E1F2"))
 
         # Data rows
+        # Project decisions into cell texts once, then fill the table in a tight loop.
+        display_names = {}
+        cell_rows = []
         for cd in decisions:
-            row = t.add_row().cells
-            path = str(cd.get("path", ""))
             # Extract just the field name from path like /record/sheets/included_articles/n_pts
-            field_name = path.split("/")[-1] if "/" in path else path
-            display_name = COLUMN_DISPLAY_NAMES.get(field_name, field_name.replace("_", " ").title())
-
-            row[0].text = _sanitize_docx_text(display_name)
-            row[1].text = _sanitize_docx_text(cd.get("final_value", "")) if cd.get("final_value") is not None else ""
-            row[2].text = _sanitize_docx_text(cd.get("status", ""))
-            row[3].text = _sanitize_docx_text(cd.get("explanation", ""))
-            row[4].text = _sanitize_docx_text(cd.get("evidence", ""))
+            field_name = str(cd.get("path", "")).rsplit("/", 1)[-1]
+            display_name = display_names.get(field_name)
+            if display_name is None:
+                display_name = COLUMN_DISPLAY_NAMES.get(field_name, field_name.replace("_", " ").title())
+                display_names[field_name] = display_name
+            final_value = cd.get("final_value")
+            cell_rows.append((
+                cd.get("status", ""),
+                (
+                    _sanitize_docx_text(display_name),
+                    _sanitize_docx_text(final_value) if final_value is not None else "",
+                    _sanitize_docx_text(cd.get("status", "")),
+                    _sanitize_docx_text(cd.get("explanation", "")),
+                    _sanitize_docx_text(cd.get("evidence", "")),
+                ),
+            ))
+
+        for status, texts in cell_rows:
+            row = t.add_row().cells
+            for cell, text in zip(row, texts):
+                cell.text = text
 
             # Color status cell
-            status = cd.get("status", "")
             if status == "AGREE":
-                shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="C6EFCE"/>')  # Light green
+                shading = _shading("C6EFCE")  # Light green
             elif status == "DISAGREE":
-                shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="FFC7CE"/>')  # Light red
+                shading = _shading("FFC7CE")  # Light red
             else:
-                shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="FFEB9C"/>')  # Light yellow
+                shading = _shading("FFEB9C")  # Light yellow
             row[2]._tc.get_or_add_tcPr().append(shading)
 
             # Set font size for all cells
@@ -1858,30 +2053,36 @@ def write_review_docx(final_obj, docx_path, append=True):
                 path_run.font.color.rgb = RGBColor(128, 128, 128)
 
     doc.save(docx_path)
+    return doc
 
 
 # -------------------------
 # FINAL OBJECT BUILD
 # -------------------------
 def compile_critical_decision_report(verifier_passes, decisions_non_null, final_driver):
+    if not decisions_non_null:
+        return [], []
     issues = []
-    latest_review_by_path = {}
-    for p in verifier_passes or []:
-        for dr in (p.get("decision_reviews") or []):
-            path = dr.get("path")
-            if path:
-                latest_review_by_path[path] = dr
+    # Later passes win, as with repeated assignment.
+    latest_review_by_path = {
+        dr["path"]: dr
+        for dr in chain.from_iterable((p.get("decision_reviews") or []) for p in (verifier_passes or []))
+        if dr.get("path")
+    }
 
     critical_report = []
+    driver_index = None  # path -> value, built on the first missing review
     for d in decisions_non_null:
         path = d.get("path")
         if not path:
             continue
         review = latest_review_by_path.get(path)
         if review is None:
+            if driver_index is None:
+                driver_index = flatten_json_pointer(final_driver)
             critical_report.append({
                 "path": path,
-                "final_value": json_pointer_get(final_driver, path),
+                "final_value": driver_index.get(path),
                 "status": "MISSING",
                 "explanation": "Missing verifier review for decision.",
                 "evidence": "",
@@ -1916,12 +2117,12 @@ def compile_critical_decision_report(verifier_passes, decisions_non_null, final_
     return critical_report, issues
 
 def build_final_object(working_obj, verifier_passes, decisions_non_null, verifier_model, extraction_notes=None):
-    merged = copy.deepcopy(working_obj)
+    merged = clone_json(working_obj)
     # Apply all suggested patches.
     for p in verifier_passes or []:
         patch = p.get("suggested_patch")
         if isinstance(patch, dict) and patch:
-            merged = deep_merge_non_null(merged, patch)
+            _merge_non_null_into(merged, patch)
 
     compute_scores_inplace(merged)
 
@@ -1955,6 +2156,16 @@ def _progress(progress_fn, message):
         ts = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
         progress_fn(f"[{ts} UTC] {message}")
 
+def _labelled_progress(progress_fn, label):
+    """progress_fn that tags each _progress line with label, for PDFs running side by side."""
+    if not progress_fn:
+        return progress_fn
+
+    def emit(line):
+        stamp, sep, message = line.partition(" UTC] ")
+        progress_fn(f"{stamp}{sep}[{label}] {message}" if sep else f"[{label}] {line}")
+    return emit
+
 def _init_working_object():
     return {
         "paper_id": {"pmid": None, "doi": None, "title": None},
@@ -1980,9 +2191,11 @@ def _apply_patch(working, patch):
 def _prune_redundant_patch_fields(patch: Optional[dict]) -> Optional[dict]:
     if not isinstance(patch, dict) or not patch:
         return patch
-    cleaned = copy.deepcopy(patch)
+    # Only the top level and record are edited; everything below is shared with patch.
+    cleaned = dict(patch)
     record = cleaned.get("record")
     if isinstance(record, dict):
+        record = cleaned["record"] = dict(record)
         sheets = record.get("sheets")
         if sheets is None or not isinstance(sheets, dict):
             record.pop("sheets", None)
@@ -1995,13 +2208,76 @@ def _prune_redundant_patch_fields(patch: Optional[dict]) -> Optional[dict]:
         cleaned.pop("study_type", None)
     return cleaned
 
+PMID_PATHS = frozenset((
+    "/paper_id/pmid",
+    "/record/sheets/included_articles/pmid",
+    "/record/sheets/level_of_evidence/pmid",
+))
+
 def _collect_decisions(all_task_results):
     return dedupe_decisions(all_task_results)
 
 
+PUBMED_HOST = "eutils.ncbi.nlm.nih.gov"
+_pubmed_local = threading.local()
+
+def _pubmed_connection(timeout: int) -> http.client.HTTPSConnection:
+    # Honour HTTPS_PROXY like urllib.request does.
+    proxy = urllib.request.getproxies().get("https")
+    if proxy and not urllib.request.proxy_bypass(PUBMED_HOST):
+        parsed = urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+        headers = {}
+        if parsed.username is not None:
+            credentials = f"{urllib.parse.unquote(parsed.username)}:{urllib.parse.unquote(parsed.password or '')}"
+            headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        default_port = 443 if parsed.scheme == "https" else 80
+        conn = http.client.HTTPSConnection(parsed.hostname, parsed.port or default_port, timeout=timeout)
+        conn.set_tunnel(PUBMED_HOST, headers=headers)
+        return conn
+    return http.client.HTTPSConnection(PUBMED_HOST, timeout=timeout)
+
+def _pubmed_get_json(path: str, timeout: int) -> dict:
+    """GET an E-utilities path over a per-thread keep-alive HTTPS connection."""
+    for attempt in range(2):
+        conn = getattr(_pubmed_local, "conn", None)
+        if conn is None:
+            conn = _pubmed_local.conn = _pubmed_connection(timeout)
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            # The server may have closed an idle connection; reconnect once.
+            conn.close()
+            _pubmed_local.conn = None
+            if attempt:
+                raise
+            continue
+        if response.status != 200:
+            raise RuntimeError(f"PubMed HTTP {response.status}: {response.reason}")
+        return loads_json(body)
+
+_pubmed_rate_lock = threading.Lock()
+_pubmed_last_request = 0.0
+
+def _pubmed_throttle(api_key: Optional[str]) -> None:
+    # NCBI allows 3 requests/s without an API key and 10 with one.
+    global _pubmed_last_request
+    interval = 0.1 if api_key else 1 / 3
+    with _pubmed_rate_lock:
+        wait = _pubmed_last_request + interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _pubmed_last_request = time.monotonic()
+
 def _pubmed_esearch(term: str, api_key: Optional[str], email: Optional[str], timeout: int) -> list[str]:
     if not term:
         return []
+    return list(_pubmed_esearch_cached(term, api_key, email, timeout))
+
+@lru_cache(maxsize=4096)
+def _pubmed_esearch_cached(term: str, api_key: Optional[str], email: Optional[str], timeout: int) -> tuple[str, ...]:
+    # Failed lookups raise and are not cached.
     params = {
         "db": "pubmed",
         "retmode": "json",
@@ -2011,15 +2287,29 @@ def _pubmed_esearch(term: str, api_key: Optional[str], email: Optional[str], tim
         params["api_key"] = api_key
     if email:
         params["email"] = email
-    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?" + urllib.parse.urlencode(params)
-    with urllib.request.urlopen(url, timeout=timeout) as response:
-        payload = json.loads(response.read().decode("utf-8"))
-    return (payload.get("esearchresult") or {}).get("idlist") or []
+    _pubmed_throttle(api_key)
+    payload = _pubmed_get_json("/entrez/eutils/esearch.fcgi?" + urllib.parse.urlencode(params), timeout)
+    return tuple((payload.get("esearchresult") or {}).get("idlist") or [])
 
 
 def lookup_pmid_via_pubmed(title: Optional[str], doi: Optional[str]) -> Optional[str]:
+    """_lookup_pmid_uncached, with resolved PMIDs persisted in LLM_CACHE_DIR when it is set."""
     if not ENABLE_PUBMED_LOOKUP:
         return None
+    cache = _get_llm_cache()
+    if cache is None:
+        return _lookup_pmid_uncached(title, doi)
+    cache_key = ExtractionCache.make_key("pubmed_pmid", (doi or "").strip().lower(), (title or "").strip().lower())
+    pmid = cache.get(cache_key)
+    if isinstance(pmid, str) and pmid:
+        return pmid
+    pmid = _lookup_pmid_uncached(title, doi)
+    # Misses are not stored: a paper not yet indexed may resolve on a later run.
+    if pmid:
+        cache.set(cache_key, pmid)
+    return pmid
+
+def _lookup_pmid_uncached(title: Optional[str], doi: Optional[str]) -> Optional[str]:
     if doi:
         ids = _pubmed_esearch(f"{doi}[DOI]", PUBMED_API_KEY, PUBMED_EMAIL, PUBMED_LOOKUP_TIMEOUT)
         if ids:
@@ -2030,6 +2320,11 @@ def lookup_pmid_via_pubmed(title: Optional[str], doi: Optional[str]) -> Optional
             return ids[0]
     return None
 
+def _write_audit_json(audit_path, final_obj):
+    # Serialize in one go and write once; orjson makes this several times faster when installed.
+    with open(audit_path, "w", encoding="utf-8") as f:
+        f.write(dumps_json(final_obj, indent=True))
+
 def run_pipeline_for_pdf(
     pdf_path,
     oai_client,
@@ -2038,9 +2333,26 @@ def run_pipeline_for_pdf(
     out_docx,
     progress_fn=print,
     clear_existing_data=False,
+    audit_writer=None,
+    pages=None,
+    review_writer=None,
 ):
+    final_obj, pmid = _extract_pdf(pdf_path, oai_client, progress_fn=progress_fn, pages=pages)
+    _write_pdf_outputs(
+        final_obj, pmid, pdf_path, template_xlsx, out_xlsx, out_docx,
+        progress_fn=progress_fn,
+        clear_existing_data=clear_existing_data,
+        audit_writer=audit_writer,
+        review_writer=review_writer,
+    )
+    return final_obj
+
+def _extract_pdf(pdf_path, oai_client, progress_fn=print, pages=None):
+    """LLM extraction and verification for one PDF. Returns (final_obj, pmid); touches no output files."""
     _progress(progress_fn, f"Starting PDF: {pdf_path}")
-    full_pages = extract_pdf_pages(pdf_path)
+    full_pages = pages if pages is not None else load_pdf_pages(pdf_path)
+    # Every task sees the same cleaned full text; build it once per PDF.
+    full_view = make_full_view(full_pages)
     paper_id_hint = extract_paper_id_from_pages(full_pages)
     if paper_id_hint.get("doi") or paper_id_hint.get("title"):
         _progress(
@@ -2055,7 +2367,8 @@ def run_pipeline_for_pdf(
 
     def run_driver(task_name, schema, user_prompt, schema_name):
         """Run extraction for a task."""
-        return openai_json(oai_client, TASK_SYSTEM, user_prompt, schema, schema_name)
+        effort = TASK_REASONING_EFFORT_OPENAI.get(task_name, REASONING_EFFORT_OPENAI)
+        return openai_json(oai_client, TASK_SYSTEM, user_prompt, schema, schema_name, reasoning_effort=effort)
 
     def verify_decisions(task_result, working_snapshot):
         """Verify decisions from a single task result immediately."""
@@ -2063,22 +2376,30 @@ def run_pipeline_for_pdf(
         if not decisions:
             return []
 
-        verifier_passes = []
         chunks = chunk_list(decisions, VERIFIER_CHUNK_SIZE)
-        working_json = sanitize_for_model_input(working_snapshot)
+        # Serialized once; every chunk sends the same driver context.
+        working_json = dumps_json(sanitize_for_model_input(working_snapshot))
+
+        def verify_chunk(ch):
+            verifier_view = build_verifier_view(full_pages, ch, full_view=full_view)
+            return verifier_fn(oai_client, verifier_view, working_json, ch)
 
-        for ch in chunks:
-            verifier_view = build_verifier_view(full_pages, ch)
-            vpass = verifier_fn(oai_client, verifier_view, working_json, ch)
-            verifier_passes.append(vpass)
-        return verifier_passes
+        if len(chunks) == 1 or VERIFIER_PARALLEL_WORKERS <= 1:
+            return [verify_chunk(ch) for ch in chunks]
+        # Chunks are independent; map() keeps the passes in chunk order.
+        with ThreadPoolExecutor(max_workers=min(VERIFIER_PARALLEL_WORKERS, len(chunks))) as executor:
+            return list(executor.map(verify_chunk, chunks))
 
     def run_task_with_verify(task_num, task_name, allowed_keys, schema_name,
-                             fields_text, sheet_key="included_articles", allowed_level_keys=None):
-        """Run a single task: extract + verify immediately. Returns (task_result, verifier_passes, patch)."""
+                             fields_text, sheet_key="included_articles", allowed_level_keys=None,
+                             on_extracted=None):
+        """Run a single task: extract + verify immediately. Returns (task_result, verifier_passes, patch).
+
+        on_extracted, if given, is called with the pruned patch before verification starts.
+        """
         _progress(progress_fn, f"Task {task_num}: {task_name} starting...")
 
-        view = make_full_view(full_pages)
+        view = full_view
         if allowed_level_keys:
             schema = build_task_schema(task_name=task_name, allowed_sheet_key=None,
                                        allowed_included_keys=allowed_keys, allowed_level_keys=allowed_level_keys)
@@ -2094,6 +2415,8 @@ def run_pipeline_for_pdf(
         # Build a minimal working object for verification context
         working_snapshot = _init_working_object()
         pruned_patch = _prune_redundant_patch_fields(task_result.get("patch"))
+        if on_extracted is not None:
+            on_extracted(pruned_patch)
         working_snapshot = _apply_patch(working_snapshot, pruned_patch)
 
         verifier_passes = verify_decisions(task_result, working_snapshot)
@@ -2103,249 +2426,104 @@ def run_pipeline_for_pdf(
         task_result["task_name"] = task_name
         return (task_result, verifier_passes, pruned_patch)
 
-    # ---- Define all tasks ----
-    task1_config = {
-        "task_num": "1/5", "task_name": "meta_design",
-        "allowed_keys": ["author", "year", "study_design"],
-        "allowed_level_keys": ["level_of_evidence", "grade_of_recommendation"],
-        "schema_name": "mronj_task_meta_design",
-        "fields_text": (
-            "EXTRACT these fields:\n"
-            "- paper_id: doi, title (from paper header/abstract); leave pmid null (resolved via PubMed)\n"
-            "- study_type: MUST be one of: " + "|".join(STUDY_TYPE_ENUM) + "\n"
-            "- included_articles.author: first author surname (e.g. 'Smith')\n"
-            "- included_articles.year: publication year as integer\n"
-            "- included_articles.study_design: brief description (e.g. 'Retrospective cohort')\n"
-            "- level_of_evidence.level_of_evidence: e.g. '1a', '2b', 'III' - only if explicitly stated\n"
-            "- level_of_evidence.grade_of_recommendation: e.g. 'A', 'B', 'C' - only if explicitly stated"
-        ),
-    }
-
-    task2_config = {
-        "task_num": "2/5", "task_name": "population",
-        "allowed_keys": ["n_pts", "age_mean_years", "gender_male_n", "gender_female_n"],
-        "schema_name": "mronj_task_population",
-        "fields_text": (
-            "EXTRACT these fields from included_articles sheet:\n"
-            "- n_pts: total number of patients/participants as integer\n"
-            "- age_mean_years: mean age in years as number (e.g. 65.4)\n"
-            "- gender_male_n: number of male participants as integer\n"
-            "- gender_female_n: number of female participants as integer\n"
-            "NOTE: Leave paper_id and study_type as null (handled by another task)"
-        ),
-    }
-
-    task3_config = {
-        "task_num": "3/5", "task_name": "indication_drugs_route_site",
-        "allowed_keys": [
-            "site_maxilla","site_mandible","site_both",
-            "primary_cause_breast_cancer","primary_cause_prostate_cancer","primary_cause_mm","primary_cause_osteoporosis","primary_cause_other",
-            "ards_bisphosphonates_zoledronate","ards_bisphosphonates_pamidronate","ards_bisphosphonates_risedronate","ards_bisphosphonates_alendronate",
-            "ards_bisphosphonates_ibandronate","ards_bisphosphonates_combination","ards_bisphosphonates_etidronate","ards_bisphosphonates_clodronate",
-            "ards_bisphosphonates_unknown_other","ards_denosumab","ards_both",
-            "route_iv","route_oral","route_im","route_subcutaneous","route_both","route_not_reported",
-        ],
-        "schema_name": "mronj_task_indication_drugs",
-        "fields_text": (
-            "EXTRACT these flags (1 if present, null if not mentioned) from included_articles sheet:\n"
-            "SITE (where MRONJ occurred):\n"
-            "- site_maxilla, site_mandible, site_both\n"
-            "PRIMARY CAUSE/INDICATION:\n"
-            "- primary_cause_breast_cancer, primary_cause_prostate_cancer, primary_cause_mm (multiple myeloma)\n"
-            "- primary_cause_osteoporosis, primary_cause_other\n"
-            "DRUGS - Bisphosphonates:\n"
-            "- ards_bisphosphonates_zoledronate (Zometa/Reclast)\n"
-            "- ards_bisphosphonates_pamidronate (Aredia)\n"
-            "- ards_bisphosphonates_alendronate (Fosamax)\n"
-            "- ards_bisphosphonates_risedronate (Actonel)\n"
-            "- ards_bisphosphonates_ibandronate (Boniva)\n"
-            "- ards_bisphosphonates_etidronate, ards_bisphosphonates_clodronate\n"
-            "- ards_bisphosphonates_combination (multiple BPs), ards_bisphosphonates_unknown_other\n"
-            "DRUGS - Other:\n"
-            "- ards_denosumab (Prolia/Xgeva), ards_both (BP + denosumab)\n"
-            "ROUTE of administration:\n"
-            "- route_iv, route_oral, route_im, route_subcutaneous, route_both, route_not_reported\n"
-            "NOTE: Leave paper_id and study_type as null (handled by another task)"
-        ),
-    }
+    # ---- Task 5: Critical appraisal (needs study_type from Task 1) ----
+    def run_appraisal_part(study_type, part_num, allowed_keys):
+        task_name = f"critical_appraisal_part{part_num}"
+        fields_text = (
+            "- Fill only these appraisal fields for study_type="
+            + study_type
+            + ":\n"
+            + ", ".join(allowed_keys)
+        )
+        schema_part = build_appraisal_schema_subset(study_type, allowed_keys)
+        user_prompt = _task_user(task_name, fields_text, full_view, context_json=None)
+        task_result = run_driver(task_name, schema_part, user_prompt, f"mronj_task_appraisal_{part_num}")
+        task_result["task_name"] = task_name
+        _progress(progress_fn, f"Task 5/5.{part_num}: critical appraisal extracted, verifying...")
 
-    task4_config = {
-        "task_num": "4/5", "task_name": "intervention_outcomes",
-        "allowed_keys": [
-            "mronj_stage_at_risk","mronj_stage_0",
-            "prevention_technique","group_intervention","group_control",
-            "follow_up_mean_months","follow_up_range","outcome_variable","mronj_development","mronj_development_details",
-        ],
-        "schema_name": "mronj_task_outcomes",
-        "fields_text": (
-            "EXTRACT these fields from included_articles sheet:\n"
-            "STAGING:\n"
-            "- mronj_stage_at_risk: number of patients at risk stage (integer)\n"
-            "- mronj_stage_0: number of patients at stage 0 (integer)\n"
-            "INTERVENTION:\n"
-            "- prevention_technique: description of prevention method used\n"
-            "- group_intervention: description of intervention group\n"
-            "- group_control: description of control group\n"
-            "FOLLOW-UP:\n"
-            "- follow_up_mean_months: mean follow-up duration in months (number)\n"
-            "- follow_up_range: follow-up range as string (e.g. '6-24 months')\n"
-            "OUTCOMES:\n"
-            "- outcome_variable: primary outcome measured\n"
-            "- mronj_development: 'Yes' or 'No' - did MRONJ develop?\n"
-            "- mronj_development_details: details about MRONJ cases if any\n"
-            "NOTE: Leave paper_id and study_type as null (handled by another task)"
-        ),
-    }
+        working_part = _init_working_object()
+        working_part = _apply_patch(working_part, task_result.get("patch"))
+        vpasses = verify_decisions(task_result, working_part)
+        return (task_result, vpasses)
 
     # ---- Run Tasks 1-4 in parallel (each with immediate verification) ----
+    # Task 5 is started from Task 1's worker as soon as its extraction returns the
+    # study_type, so the appraisal overlaps Task 1's verification and Tasks 2-4.
     _progress(progress_fn, "Running tasks 1-4 in parallel...")
 
     all_task_results = []
     all_verifier_passes = []
     all_patches = []
-    task1_result = None  # Need this for Task 5's study_type
-
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_task1 = executor.submit(
-            run_task_with_verify, task1_config["task_num"], task1_config["task_name"],
-            task1_config["allowed_keys"], task1_config["schema_name"],
-            task1_config["fields_text"], None, task1_config["allowed_level_keys"]
-        )
-        future_task2 = executor.submit(
-            run_task_with_verify, task2_config["task_num"], task2_config["task_name"],
-            task2_config["allowed_keys"], task2_config["schema_name"],
-            task2_config["fields_text"]
-        )
-        future_task3 = executor.submit(
-            run_task_with_verify, task3_config["task_num"], task3_config["task_name"],
-            task3_config["allowed_keys"], task3_config["schema_name"],
-            task3_config["fields_text"]
-        )
-        future_task4 = executor.submit(
-            run_task_with_verify, task4_config["task_num"], task4_config["task_name"],
-            task4_config["allowed_keys"], task4_config["schema_name"],
-            task4_config["fields_text"]
-        )
-
-        # Collect results
-        task1_result, task1_vpasses, task1_patch = future_task1.result()
-        all_task_results.append(task1_result)
-        all_verifier_passes.extend(task1_vpasses)
-        all_patches.append(task1_patch)
-
-        task2_result, task2_vpasses, task2_patch = future_task2.result()
-        all_task_results.append(task2_result)
-        all_verifier_passes.extend(task2_vpasses)
-        all_patches.append(task2_patch)
-
-        task3_result, task3_vpasses, task3_patch = future_task3.result()
-        all_task_results.append(task3_result)
-        all_verifier_passes.extend(task3_vpasses)
-        all_patches.append(task3_patch)
+    appraisal_futures = []
 
-        task4_result, task4_vpasses, task4_patch = future_task4.result()
-        all_task_results.append(task4_result)
-        all_verifier_passes.extend(task4_vpasses)
-        all_patches.append(task4_patch)
+    with ThreadPoolExecutor(max_workers=6) as executor:
 
-    # ---- Task 5: Critical appraisal (needs study_type from Task 1) ----
-    # Get study_type from task1 result
-    task1_patch_obj = task1_patch or {}
-    study_type = task1_patch_obj.get("study_type") or "unclear"
-
-    if study_type in ("rct", "cohort", "case_series", "case_control", "systematic_review"):
-        _progress(progress_fn, f"Task 5/5: critical appraisal ({study_type}) starting...")
-        view5 = make_full_view(full_pages)
-
-        appraisal_question_keys = {
-            "rct": ["q1_randomized", "q2_randomization_method", "q3_double_blind", "q4_blinding_method", "q5_withdrawals_dropouts"],
-            "cohort": [
-                "q1_groups_similar", "q2_exposures_measured_similarly", "q3_exposure_valid_reliable",
-                "q4_confounders_identified", "q5_confounders_addressed", "q6_free_of_outcome_at_start",
-                "q7_outcomes_valid_reliable", "q8_followup_sufficient", "q9_followup_complete",
-                "q10_address_incomplete_followup", "q11_appropriate_statistics",
-            ],
-            "case_series": [
-                "q1_inclusion_criteria_clear", "q2_condition_measured_standard", "q3_valid_identification_methods",
-                "q4_consecutive_inclusion", "q5_complete_inclusion", "q6_demographics_reported",
-                "q7_clinical_info_reported", "q8_outcomes_followup_reported", "q9_presenting_site_reported",
-                "q10_statistics_appropriate",
-            ],
-            "case_control": [
-                "q1_groups_comparable", "q2_matched_appropriately", "q3_same_criteria_cases_controls",
-                "q4_exposure_valid_reliable", "q5_exposure_measured_same_way", "q6_confounders_identified",
-                "q7_confounders_addressed", "q8_outcomes_assessed_standard", "q9_exposure_period_long_enough",
-                "q10_appropriate_statistics",
-            ],
-            "systematic_review": [
-                "q1_pico", "q2_protocol_predefined", "q3_designs_explained", "q4_6_search_and_duplicates",
-                "q7_excluded_list", "q8_included_described", "q9_risk_of_bias", "q10_funding_sources",
-                "q11_meta_analysis_methods", "q12_impact_of_rob", "q13_account_for_rob",
-                "q14_heterogeneity_explained", "q15_publication_bias", "q16_conflicts_reported",
-            ],
-        }
-
-        meta_keys = ["pmid", "author", "year", "study_design"]
-        question_keys = appraisal_question_keys.get(study_type, [])
-        mid = max(1, len(question_keys) // 2)
-        part1_keys = meta_keys + question_keys[:mid]
-        part2_keys = question_keys[mid:]
-
-        def run_appraisal_part(part_num, allowed_keys):
-            if not allowed_keys:
+        def start_appraisal(task1_patch):
+            study_type = (task1_patch or {}).get("study_type") or "unclear"
+            if study_type not in APPRAISAL_QUESTION_KEYS:
+                _progress(progress_fn, "Task 5/5 skipped (study_type unclear/other).")
                 return
-            task_name = f"critical_appraisal_part{part_num}"
-            fields_text = (
-                "- Fill only these appraisal fields for study_type="
-                + study_type
-                + ":\n"
-                + ", ".join(allowed_keys)
+            _progress(progress_fn, f"Task 5/5: critical appraisal ({study_type}) starting...")
+            meta_keys = ["pmid", "author", "year", "study_design"]
+            question_keys = APPRAISAL_QUESTION_KEYS[study_type]
+            mid = max(1, len(question_keys) // 2)
+            # The two parts are independent and run side by side; results are
+            # collected in part order so the merge stays deterministic.
+            for part_num, keys in ((1, meta_keys + question_keys[:mid]), (2, question_keys[mid:])):
+                if keys:
+                    appraisal_futures.append(executor.submit(run_appraisal_part, study_type, part_num, keys))
+
+        task_futures = [
+            executor.submit(
+                run_task_with_verify, cfg["task_num"], cfg["task_name"], cfg["allowed_keys"],
+                cfg["schema_name"], cfg["fields_text"], cfg.get("sheet_key", "included_articles"),
+                cfg.get("allowed_level_keys"),
+                on_extracted=start_appraisal if cfg is _TASK1_CONFIG else None,
             )
-            schema_part = build_appraisal_schema_subset(study_type, allowed_keys)
-            user_prompt = _task_user(task_name, fields_text, view5, context_json=None)
-            task_result = run_driver(task_name, schema_part, user_prompt, f"mronj_task_appraisal_{part_num}")
-            task_result["task_name"] = task_name
-            _progress(progress_fn, f"Task 5/5.{part_num}: critical appraisal extracted, verifying...")
+            for cfg in EXTRACTION_TASKS
+        ]
 
-            working_part = _init_working_object()
-            working_part = _apply_patch(working_part, task_result.get("patch"))
-            vpasses = verify_decisions(task_result, working_part)
+        # Collect results in task order; Task 1 finishing guarantees Task 5 was submitted.
+        for fut in task_futures:
+            task_result, vpasses, patch = fut.result()
+            all_task_results.append(task_result)
+            all_verifier_passes.extend(vpasses)
+            all_patches.append(patch)
 
+        for fut in appraisal_futures:
+            task_result, vpasses = fut.result()
             all_task_results.append(task_result)
             all_verifier_passes.extend(vpasses)
             all_patches.append(task_result.get("patch"))
-
-        run_appraisal_part(1, part1_keys)
-        run_appraisal_part(2, part2_keys)
-        _progress(progress_fn, "Task 5/5: critical appraisal done.")
-    else:
-        _progress(progress_fn, "Task 5/5 skipped (study_type unclear/other).")
+        if appraisal_futures:
+            _progress(progress_fn, "Task 5/5: critical appraisal done.")
 
     # ---- Merge all results ----
     _progress(progress_fn, "Merging all task results...")
+    # working is freshly built and owned here, so task patches are merged in place
+    # instead of re-copying the whole tree once per patch.
     working = _init_working_object()
     for patch in all_patches:
-        if patch:
-            working = _apply_patch(working, patch)
+        if isinstance(patch, dict) and patch:
+            _merge_into(working, patch)
 
     # Apply verifier corrections
     for vpass in all_verifier_passes:
         if vpass:
             patch = vpass.get("suggested_patch")
             if isinstance(patch, dict) and patch:
-                working = deep_merge_non_null(working, patch)
+                _merge_non_null_into(working, patch)
 
+    paper_id = working.setdefault("paper_id", {})
     if ENABLE_PUBMED_LOOKUP:
-        working.setdefault("paper_id", {})["pmid"] = None
-
-    working.setdefault("paper_id", {})
+        paper_id["pmid"] = None
     if paper_id_hint.get("doi"):
-        working["paper_id"]["doi"] = paper_id_hint.get("doi")
+        paper_id["doi"] = paper_id_hint.get("doi")
     if paper_id_hint.get("title"):
-        working["paper_id"]["title"] = paper_id_hint.get("title")
+        paper_id["title"] = paper_id_hint.get("title")
 
     # Optional PMID lookup via PubMed if missing, using PDF-derived DOI/title.
-    if ENABLE_PUBMED_LOOKUP and not (working.get("paper_id") or {}).get("pmid"):
+    if ENABLE_PUBMED_LOOKUP and not paper_id.get("pmid"):
         lookup_doi = paper_id_hint.get("doi")
         lookup_title = paper_id_hint.get("title")
         if lookup_doi or lookup_title:
@@ -2355,44 +2533,36 @@ def run_pipeline_for_pdf(
                 _progress(progress_fn, f"PubMed lookup failed: {exc}")
                 found_pmid = None
             if found_pmid:
-                working.setdefault("paper_id", {})["pmid"] = found_pmid
+                paper_id["pmid"] = found_pmid
         else:
             _progress(progress_fn, "PubMed lookup skipped (no PDF DOI/title found).")
 
-    # Ensure pmid is copied to included_articles + level_of_evidence for convenience.
-    pmid = (working.get("paper_id") or {}).get("pmid")
-
     # Ensure nested structures exist
-    if "record" not in working:
-        working["record"] = {}
-    if not isinstance(working["record"].get("sheets"), dict):
-        working["record"]["sheets"] = {}
-    if working["record"]["sheets"].get("included_articles") is None:
-        working["record"]["sheets"]["included_articles"] = {}
-    if working["record"]["sheets"].get("level_of_evidence") is None:
-        working["record"]["sheets"]["level_of_evidence"] = {}
+    record = working.setdefault("record", {})
+    sheets = record.get("sheets")
+    if not isinstance(sheets, dict):
+        sheets = record["sheets"] = {}
+    inc = sheets.get("included_articles")
+    if inc is None:
+        inc = sheets["included_articles"] = {}
+    loe = sheets.get("level_of_evidence")
+    if loe is None:
+        loe = sheets["level_of_evidence"] = {}
 
+    # Ensure pmid is copied to included_articles + level_of_evidence for convenience.
+    pmid = paper_id.get("pmid")
     if pmid is not None:
-        working["record"]["sheets"]["included_articles"]["pmid"] = pmid
-        working["record"]["sheets"]["level_of_evidence"]["pmid"] = pmid
+        inc["pmid"] = pmid
+        loe["pmid"] = pmid
 
     # Copy author/year/design if we have them.
-    inc = working["record"]["sheets"].get("included_articles") or {}
-    for k in ("author", "year", "study_design"):
-        if inc.get(k) not in (None, ""):
-            working["record"]["sheets"]["level_of_evidence"][k] = inc.get(k)
+    loe.update({k: inc[k] for k in ("author", "year", "study_design") if inc.get(k) not in (None, "")})
 
     # Collect all decisions for final object
     all_decisions = _collect_decisions(all_task_results)
     if ENABLE_PUBMED_LOOKUP:
-        all_decisions = [
-            d for d in all_decisions
-            if d.get("path") not in (
-                "/paper_id/pmid",
-                "/record/sheets/included_articles/pmid",
-                "/record/sheets/level_of_evidence/pmid",
-            )
-        ]
+        # The PMID comes from PubMed, so extracted PMID decisions are dropped in the same pass.
+        all_decisions = (d for d in all_decisions if d.get("path") not in PMID_PATHS)
     decisions_non_null = decisions_only_non_null(all_decisions)
 
     extraction_notes = []
@@ -2414,14 +2584,36 @@ def run_pipeline_for_pdf(
         verifier_model=verifier_model,
         extraction_notes=extraction_notes,
     )
+    return final_obj, pmid
 
+def _write_pdf_outputs(
+    final_obj,
+    pmid,
+    pdf_path,
+    template_xlsx,
+    out_xlsx,
+    out_docx,
+    progress_fn=print,
+    clear_existing_data=False,
+    audit_writer=None,
+    review_writer=None,
+    workbook_writer=None,
+):
+    # Output files are shared across the batch, so this always runs on the caller's thread, in PDF order.
     _progress(progress_fn, "Writing Excel + Word outputs...")
-    apply_to_workbook(final_obj, template_xlsx, out_xlsx, EXCEL_MAP, clear_existing_data=clear_existing_data)
-    write_review_docx(final_obj, out_docx, append=True)
+    if workbook_writer is not None:
+        workbook_writer(final_obj, template_xlsx, clear_existing_data)
+    else:
+        apply_to_workbook(final_obj, template_xlsx, out_xlsx, EXCEL_MAP, clear_existing_data=clear_existing_data)
+    if review_writer is not None:
+        review_writer(final_obj)
+    else:
+        write_review_docx(final_obj, out_docx, append=True)
 
-    audit_path = out_xlsx.replace(".xlsx", f".audit_{pmid}.json")
-    with open(audit_path, "w", encoding="utf-8") as f:
-        json.dump(final_obj, f, ensure_ascii=False, indent=2)
+    # audit_writer lets run_pipeline move the audit dump off the critical path.
+    if WRITE_AUDIT_JSON:
+        audit_path = out_xlsx.replace(".xlsx", f".audit_{pmid}.json")
+        (audit_writer or _write_audit_json)(audit_path, final_obj)
 
     _progress(progress_fn, f"Completed PDF: {pdf_path}")
     return final_obj
@@ -2436,6 +2628,7 @@ def run_pipeline(
     progress_fn=print,
     skip_existing_evals=True,
     processed_state_path=None,
+    concurrency=None,
 ):
     if not pdf_paths:
         raise RuntimeError("pdf_paths is empty. Provide at least one PDF path.")
@@ -2448,70 +2641,132 @@ def run_pipeline(
     if not openai_key:
         raise RuntimeError("Missing OPENAI_API_KEY.")
 
-    oai_client = OpenAI(api_key=openai_key)
-
-    def load_processed_state(state_path):
-        if not state_path or not os.path.exists(state_path):
-            return []
-        try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-            if isinstance(payload, list):
-                return payload
-        except Exception as exc:
-            _progress(progress_fn, f"Warning: failed to read processed state ({state_path}): {exc}")
-        return []
-
-    def write_processed_state(state_path, entries):
-        if not state_path:
-            return
-        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
+    oai_client = get_openai_client(openai_key)
+
+    # Processed state is an append-only JSONL log: one entry per finished PDF.
+    state_path = processed_state_path or f"{out_xlsx}.processed.jsonl"
+    legacy_path = None if processed_state_path else f"{out_xlsx}.processed.json"
+    try:
+        processed_entries = load_processed_state(state_path, legacy_path=legacy_path)
+    except Exception as exc:
+        _progress(progress_fn, f"Warning: failed to read processed state ({state_path}): {exc}")
+        processed_entries = []
+    processed_set = {os.path.abspath(e.get("pdf_path")) for e in processed_entries if e.get("pdf_path")}
+
+    # Stat out_xlsx once; after the first write it exists for the rest of the run.
+    out_exists = os.path.exists(out_xlsx)
+    current_template = out_xlsx if out_exists else actual_template
+    finals = []
 
-    state_path = processed_state_path or f"{out_xlsx}.processed.json"
-    processed_entries = load_processed_state(state_path)
-    processed_set = {os.path.abspath(e.get("pdf_path")) for e in processed_entries if isinstance(e, dict) and e.get("pdf_path")}
+    # Audit JSON is written on a background thread so the next PDF's LLM calls
+    # overlap with serializing the previous one. The PDF's state entry is appended
+    # by the same job after the audit is on disk, so a crash or a failed write never
+    # leaves a paper marked processed without its audit.
+    io_pool = ThreadPoolExecutor(max_workers=1)
+    finish_futures = []
+
+    def finish_pdf(audit_job, entry):
+        if audit_job is not None:
+            _write_audit_json(*audit_job)
+        append_processed_state(state_path, entry)
+
+    def check_finished():
+        # Surface write errors at the next PDF rather than after the whole batch.
+        while finish_futures and finish_futures[0].done():
+            finish_futures.pop(0).result()
+
+    # The review log stays open across the batch; it is still saved after every paper
+    # so it never lags the processed state file.
+    review_doc = None
+
+    def write_review(final_obj):
+        nonlocal review_doc
+        review_doc = write_review_docx(final_obj, out_docx, append=True, doc=review_doc)
+
+    # Likewise the workbook is loaded once and saved after every paper.
+    workbook = None
+
+    def write_workbook(final_obj, template_xlsx, clear_existing_data):
+        nonlocal workbook
+        workbook = apply_to_workbook(
+            final_obj, template_xlsx, out_xlsx, EXCEL_MAP,
+            clear_existing_data=clear_existing_data, wb=workbook,
+        )
 
-    current_template = out_xlsx if os.path.exists(out_xlsx) else actual_template
-    finals = []
-    processed_this_run = 0
-    for idx, pdf in enumerate(pdf_paths):
+    # Up to `concurrency` (default PDF_PARALLEL_WORKERS) PDFs are extracted ahead of
+    # the one being written. Page text goes through a single worker so all PyMuPDF use
+    # stays on one thread; outputs are written here, in input order.
+    pdf_workers = max(1, concurrency or PDF_PARALLEL_WORKERS)
+    page_pool = ThreadPoolExecutor(max_workers=1)
+    pdf_pool = ThreadPoolExecutor(max_workers=pdf_workers)
+    extract_futures = {}
+
+    # Resolve paths and skips once up front, so the loop below only sees real work.
+    todo = []
+    queued = set()
+    for pdf in pdf_paths:
         if not os.path.exists(pdf):
             raise FileNotFoundError(pdf)
-
         abs_pdf = os.path.abspath(pdf)
-        if skip_existing_evals and abs_pdf in processed_set:
+        if skip_existing_evals and (abs_pdf in processed_set or abs_pdf in queued):
             _progress(progress_fn, f"Skipping already processed PDF: {pdf}")
             continue
+        queued.add(abs_pdf)
+        todo.append((pdf, abs_pdf))
 
-        # Clear old/demo data only when creating a new output workbook
-        is_first_pdf = (processed_this_run == 0 and not os.path.exists(out_xlsx))
-
-        final_obj = run_pipeline_for_pdf(
-            pdf_path=pdf,
-            oai_client=oai_client,
-            template_xlsx=current_template,
-            out_xlsx=out_xlsx,
-            out_docx=out_docx,
-            progress_fn=progress_fn,
-            clear_existing_data=is_first_pdf,
+    def submit_extract(idx):
+        if idx in extract_futures:
+            return
+        path = todo[idx][0]
+        pdf_progress = _labelled_progress(progress_fn, os.path.basename(path))
+        pages_future = page_pool.submit(load_pdf_pages, path)
+        extract_futures[idx] = pdf_pool.submit(
+            lambda: _extract_pdf(path, oai_client, progress_fn=pdf_progress, pages=pages_future.result())
         )
-        current_template = out_xlsx
-        finals.append(final_obj)
-        processed_this_run += 1
-
-        pid = final_obj.get("paper_id") or {}
-        _progress(progress_fn, "DONE pdf=" + str(pdf) + " pmid=" + str(pid.get("pmid")) + " study_type=" + str(final_obj.get("study_type")) + " needs_human_review=" + str((final_obj.get("validation") or {}).get("needs_human_review")))
-
-        processed_entry = {
-            "pdf_path": abs_pdf,
-            "pmid": pid.get("pmid"),
-            "processed_at": datetime.now(UTC).isoformat(),
-        }
-        processed_entries.append(processed_entry)
-        processed_set.add(abs_pdf)
-        write_processed_state(state_path, processed_entries)
+
+    failed = True
+    try:
+        for idx, (pdf, abs_pdf) in enumerate(todo):
+            for ahead in range(idx, min(idx + pdf_workers, len(todo))):
+                submit_extract(ahead)
+            final_obj, pmid = extract_futures.pop(idx).result()
+
+            check_finished()
+
+            # Clear old/demo data only when creating a new output workbook
+            is_first_pdf = not out_exists
+
+            audit_jobs = []
+            _write_pdf_outputs(
+                final_obj, pmid, pdf, current_template, out_xlsx, out_docx,
+                progress_fn=progress_fn,
+                clear_existing_data=is_first_pdf,
+                audit_writer=lambda audit_path, obj: audit_jobs.append((audit_path, obj)),
+                review_writer=write_review,
+                workbook_writer=write_workbook,
+            )
+            current_template = out_xlsx
+            out_exists = True
+            finals.append(final_obj)
+
+            pid = final_obj.get("paper_id") or {}
+            _progress(progress_fn, "DONE pdf=" + str(pdf) + " pmid=" + str(pid.get("pmid")) + " study_type=" + str(final_obj.get("study_type")) + " needs_human_review=" + str((final_obj.get("validation") or {}).get("needs_human_review")))
+
+            processed_entry = {
+                "pdf_path": abs_pdf,
+                "pmid": pid.get("pmid"),
+                "processed_at": datetime.now(UTC).isoformat(),
+            }
+            finish_futures.append(io_pool.submit(finish_pdf, audit_jobs[0] if audit_jobs else None, processed_entry))
+        failed = False
+    finally:
+        # On failure, raise right away instead of waiting for look-ahead extractions
+        # already in flight; their results would be discarded anyway.
+        pdf_pool.shutdown(wait=not failed, cancel_futures=True)
+        page_pool.shutdown(wait=not failed, cancel_futures=True)
+        io_pool.shutdown(wait=True)
+    for fut in finish_futures:
+        fut.result()
 
     _progress(progress_fn, f"WROTE_XLSX: {out_xlsx}")
     _progress(progress_fn, f"WROTE_DOCX: {out_docx}")
@@ -1,9 +1,16 @@
 import pytest
 
 from paperchecker_utils import (
+    ExtractionCache,
+    append_processed_state,
+    clone_json,
     dedupe_decisions,
+    dumps_json,
+    flatten_json_pointer,
     json_pointer_get,
     json_pointer_set,
+    load_processed_state,
+    loads_json,
     normalize_pmid,
 )
 
@@ -15,6 +22,14 @@ def test_json_pointer_get_handles_lists_and_invalid_indexes():
     assert json_pointer_get(data, "/items/not-an-index/value") is None
 
 
+def test_flatten_json_pointer_matches_json_pointer_get():
+    data = {"record": {"a/b": 1, "items": [{"value": None}]}}
+    flat = flatten_json_pointer(data)
+    for pointer in ("/record", "/record/a~1b", "/record/items/0", "/record/items/0/value"):
+        assert flat[pointer] is json_pointer_get(data, pointer)
+    assert flat.get("/record/missing") is None
+
+
 def test_json_pointer_set_rejects_invalid_indexes():
     data = {"items": ["a", "b"]}
     json_pointer_set(data, "/items/1", "c")
@@ -23,6 +38,21 @@ def test_json_pointer_set_rejects_invalid_indexes():
         json_pointer_set(data, "/items/3", "d")
 
 
+def test_clone_json_copies_nested_containers():
+    data = {"a": [{"b": 1}], "c": "x"}
+    cloned = clone_json(data)
+    assert cloned == data
+    cloned["a"][0]["b"] = 2
+    assert data["a"][0]["b"] == 1
+
+
+def test_dumps_json_is_compact_and_round_trips():
+    data = {"b": [1, 2.5, None], "a": "Müller"}
+    text = dumps_json(data, sort_keys=True)
+    assert text == '{"a":"Müller","b":[1,2.5,null]}'
+    assert loads_json(text) == data
+
+
 def test_normalize_pmid_matches_numeric_variants():
     assert normalize_pmid(123456) == "123456"
     assert normalize_pmid(123456.0) == "123456"
@@ -39,3 +69,35 @@ def test_dedupe_decisions_prefers_latest():
     deduped = dedupe_decisions(task_results)
     assert [d["path"] for d in deduped] == ["/b", "/a"]
     assert next(d for d in deduped if d["path"] == "/a")["value"] == 3
+
+
+def test_extraction_cache_roundtrip_and_length_prefixed_keys(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    assert ExtractionCache.make_key("ab", "c") != ExtractionCache.make_key("a", "bc")
+    key = ExtractionCache.make_key("model", "schema", "prompt")
+    assert cache.get(key) is None
+    cache.set(key, {"patch": {"a": 1}}, model="model")
+    assert cache.get(key) == {"patch": {"a": 1}}
+    cache.delete(key)
+    assert cache.get(key) is None
+
+
+def test_load_processed_state_migrates_legacy_list(tmp_path):
+    legacy = tmp_path / "out.xlsx.processed.json"
+    legacy.write_text('[\n  {"pdf_path": "/a.pdf", "pmid": "1"}\n]', encoding="utf-8")
+    state = tmp_path / "out.xlsx.processed.jsonl"
+    assert load_processed_state(str(state), legacy_path=str(legacy)) == [{"pdf_path": "/a.pdf", "pmid": "1"}]
+    assert state.read_text(encoding="utf-8") == '{"pdf_path":"/a.pdf","pmid":"1"}\n'
+
+    # A legacy list passed as the state file itself is rewritten in place.
+    legacy.write_text('[{"pdf_path": "/b.pdf"}]', encoding="utf-8")
+    assert load_processed_state(str(legacy)) == [{"pdf_path": "/b.pdf"}]
+    assert legacy.read_text(encoding="utf-8") == '{"pdf_path":"/b.pdf"}\n'
+
+
+def test_load_processed_state_drops_truncated_final_line(tmp_path):
+    state = tmp_path / "state.jsonl"
+    state.write_text('{"pdf_path": "/a.pdf"}\n{"pdf_pa', encoding="utf-8")
+    assert load_processed_state(str(state)) == [{"pdf_path": "/a.pdf"}]
+    append_processed_state(str(state), {"pdf_path": "/b.pdf"})
+    assert load_processed_state(str(state)) == [{"pdf_path": "/a.pdf"}, {"pdf_path": "/b.pdf"}]